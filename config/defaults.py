@@ -10,12 +10,12 @@ DEFAULT_CONFIG = {
         "create_subfolders": True,
         "folder_template": "{title}",
         "filename_template": "{page:03d}.{ext}",
-        "max_concurrent": 8,
+        "max_concurrent": 32,
         "retry_attempts": 3,
         "use_aria2": True,
         "aria2_path": "aria2c",
         "max_parallel_galleries": 3,
-        "max_connections_per_server": 8,
+        "max_connections_per_server": 16,
     },
     "metadata": {
         "save_metadata": True,
@@ -29,6 +29,15 @@ DEFAULT_CONFIG = {
         "database_path": str(Path.home() / ".hfox" / "history.db"),
         "max_history_entries": 10000,
     },
+    "cache": {
+        "database_path": str(Path.home() / ".hfox" / "cache.db"),
+        "search_ttl": 86400,  # Seconds to keep cached search pages (24h)
+        "gallery_info_ttl": 604800,  # Seconds to keep cached gallery info (7d)
+        "max_search_pages": 50,  # Search pages kept in memory per session
+        "max_http_entries": 1000,  # Gallery pages kept for conditional requests
+        "thumbnail_dir": str(Path.home() / ".hfox" / "thumbnails"),
+        "thumbnail_max_age": 604800,  # Seconds before a cached thumbnail is revalidated (7d)
+    },
     "display": {
         "show_progress": True,
         "use_colors": True,
@@ -1,18 +1,28 @@
 """Configuration management for HFox Downloader."""
 
 import os
+import copy
 import yaml
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .defaults import DEFAULT_CONFIG, CONFIG_DIRS, CONFIG_FILENAME
 
+# Marker for keys missing from the config
+_MISSING = object()
+
 
 class ConfigManager:
     """Manages application configuration with YAML file support."""
     
     def __init__(self):
-        self.config: Dict[str, Any] = DEFAULT_CONFIG.copy()
+        self.config: Dict[str, Any] = copy.deepcopy(DEFAULT_CONFIG)
         self.config_path: Optional[Path] = None
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._resolve = lru_cache(maxsize=512)(self._resolve_key)
+        self._suspend_save = False
+        self._mtime: Optional[float] = None
         self._load_config()
     
     def _find_config_file(self) -> Optional[Path]:
@@ -47,11 +57,37 @@ class ConfigManager:
             
             # Merge user config with defaults
             self._deep_merge(self.config, user_config)
+            self._mtime = self._stat_mtime()
+            self._invalidate_caches()
             
         except Exception as e:
             print(f"Warning: Could not load config file: {e}")
             print("Using default configuration.")
     
+    def _stat_mtime(self) -> Optional[float]:
+        """Get the config file's modification time, or None if unavailable."""
+        try:
+            return os.stat(self.config_path).st_mtime
+        except (OSError, TypeError):
+            return None
+    
+    def reload(self):
+        """Re-read the config file only if it changed on disk since the last load or save."""
+        if self.config_path is None or self._stat_mtime() == self._mtime:
+            return
+        
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                user_config = yaml.safe_load(f) or {}
+        except Exception as e:
+            print(f"Warning: Could not reload config file: {e}")
+            return
+        
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
+        self._deep_merge(self.config, user_config)
+        self._mtime = self._stat_mtime()
+        self._invalidate_caches()
+    
     def _deep_merge(self, base: Dict, update: Dict):
         """Recursively merge update dict into base dict."""
         for key, value in update.items():
@@ -65,21 +101,30 @@ class ConfigManager:
         with open(file_path, 'w', encoding='utf-8') as f:
             yaml.dump(config, f, default_flow_style=False, indent=2)
     
-    def get(self, key_path: str, default=None):
-        """Get config value using dot notation (e.g., 'download.base_path')."""
-        keys = key_path.split('.')
+    def _invalidate_caches(self):
+        """Drop cached lookups after the config changes."""
+        self._snapshot = None
+        self._resolve.cache_clear()
+    
+    def _resolve_key(self, key_path: str):
+        """Resolve a dotted key, returning _MISSING if any part is absent."""
         value = self.config
         
-        for key in keys:
+        for key in key_path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return default
+                return _MISSING
         
         return value
     
-    def set(self, key_path: str, value: Any):
-        """Set config value using dot notation."""
+    def get(self, key_path: str, default=None):
+        """Get config value using dot notation (e.g., 'download.base_path')."""
+        value = self._resolve(key_path)
+        return default if value is _MISSING else value
+    
+    def _set_value(self, key_path: str, value: Any):
+        """Set a nested value without touching the caches."""
         keys = key_path.split('.')
         config = self.config
         
@@ -90,15 +135,66 @@ class ConfigManager:
         
         config[keys[-1]] = value
     
+    def set(self, key_path: str, value: Any):
+        """Set config value using dot notation."""
+        self._set_value(key_path, value)
+        self._invalidate_caches()
+    
+    def update(self, values: Dict[str, Any]):
+        """Set several config values at once, keyed by dot notation."""
+        for key_path, value in values.items():
+            self._set_value(key_path, value)
+        self._invalidate_caches()
+    
+    @contextmanager
+    def batch(self):
+        """Defer saving until the block exits, then write the file once.
+        
+        If the block raises, its changes are rolled back and nothing is written.
+        """
+        previous = copy.deepcopy(self.config)
+        self._suspend_save = True
+        try:
+            yield self
+        except BaseException:
+            self.config = previous
+            self._invalidate_caches()
+            raise
+        finally:
+            self._suspend_save = False
+        self.save()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a read-only flat view of all values keyed by dot notation."""
+        if self._snapshot is None:
+            self._snapshot = self._flatten(self.config)
+        return self._snapshot
+    
+    def _flatten(self, config: Dict, prefix: str = "") -> Dict[str, Any]:
+        """Flatten nested config dicts into dotted keys."""
+        flat = {}
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{path}."))
+            else:
+                flat[path] = value
+        return flat
+    
     def save(self):
         """Save current configuration to file."""
+        if self._suspend_save:
+            return
         if self.config_path:
             self._save_config_to_file(self.config_path, self.config)
+            self._mtime = self._stat_mtime()
     
-    def reset_to_defaults(self):
-        """Reset configuration to default values."""
-        self.config = DEFAULT_CONFIG.copy()
+    def reset_to_defaults(self) -> Dict[str, Any]:
+        """Reset configuration to default values and return them flattened."""
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
+        self._invalidate_caches()
         self.save()
+        return self.snapshot()
 
 
 # Global config instance
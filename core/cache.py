@@ -0,0 +1,172 @@
+"""Persistent cache for search pages, gallery information and page validators."""
+
+import sqlite3
+import json
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional
+from dataclasses import asdict
+
+from config.settings import config
+from .sites.base import GalleryInfo, GallerySummary
+
+
+class SearchCache:
+    """Keeps search result pages and gallery info across sessions using SQLite."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            db_path = config.get("cache.database_path", str(Path.home() / ".hfox" / "cache.db"))
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.search_ttl = config.get("cache.search_ttl", 86400)
+        self.gallery_info_ttl = config.get("cache.gallery_info_ttl", 604800)
+        self.max_http_entries = config.get("cache.max_http_entries", 1000)
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize the cache database."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_pages (
+                    key TEXT PRIMARY KEY,
+                    results TEXT NOT NULL,
+                    total_pages INTEGER NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS gallery_info (
+                    url TEXT PRIMARY KEY,
+                    info TEXT NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    info TEXT NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_pages_ts ON search_pages(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_gallery_info_ts ON gallery_info(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_ts ON http_cache(ts)")
+
+    def put_search_page(self, key: str, results: List[GallerySummary], total_pages: int):
+        """Store a page of search results."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_pages (key, results, total_pages, ts) VALUES (?, ?, ?, ?)",
+                (key, json.dumps([result._asdict() for result in results]), total_pages, int(time.time()))
+            )
+
+    def load_search_pages(self, limit: int = 50) -> List[Tuple[str, List[GallerySummary], int]]:
+        """Load unexpired search pages, oldest first, dropping expired rows."""
+        cutoff = int(time.time()) - self.search_ttl
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM search_pages WHERE ts <= ?", (cutoff,))
+            cursor = conn.execute(
+                "SELECT key, results, total_pages FROM search_pages ORDER BY ts DESC LIMIT ?",
+                (limit,)
+            )
+
+            pages = []
+            for key, results, total_pages in cursor.fetchall():
+                try:
+                    pages.append((key, [GallerySummary(**row) for row in json.loads(results)], total_pages))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+
+            pages.reverse()
+            return pages
+
+    def put_gallery_info(self, gallery_info: GalleryInfo):
+        """Store gallery information keyed by its URL."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO gallery_info (url, info, ts) VALUES (?, ?, ?)",
+                (gallery_info.url, json.dumps(asdict(gallery_info)), int(time.time()))
+            )
+
+    def load_gallery_info(self) -> Dict[str, GalleryInfo]:
+        """Load unexpired gallery information, dropping expired rows."""
+        cutoff = int(time.time()) - self.gallery_info_ttl
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM gallery_info WHERE ts <= ?", (cutoff,))
+            cursor = conn.execute("SELECT url, info FROM gallery_info")
+
+            infos = {}
+            for url, info in cursor.fetchall():
+                try:
+                    infos[url] = GalleryInfo(**json.loads(info))
+                except (json.JSONDecodeError, TypeError):
+                    continue
+
+            return infos
+
+    def get_http_cached(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], GalleryInfo]]:
+        """Get the stored (etag, last_modified, info) for a gallery URL."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT etag, last_modified, info FROM http_cache WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if not row:
+            return None
+
+        etag, last_modified, info = row
+        try:
+            return etag, last_modified, GalleryInfo(**json.loads(info))
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def put_http_cached(self, url: str, etag: Optional[str], last_modified: Optional[str], info: GalleryInfo):
+        """Store the response validators and parsed info for a gallery URL, evicting old entries."""
+        now = int(time.time())
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, info, ts) VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, json.dumps(asdict(info)), now)
+                )
+                conn.execute("DELETE FROM http_cache WHERE ts <= ?", (now - self.gallery_info_ttl,))
+                conn.execute(
+                    "DELETE FROM http_cache WHERE url NOT IN (SELECT url FROM http_cache ORDER BY ts DESC LIMIT ?)",
+                    (self.max_http_entries,)
+                )
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """Clear all cached entries."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM search_pages")
+            conn.execute("DELETE FROM gallery_info")
+            conn.execute("DELETE FROM http_cache")
+            conn.commit()
+
+
+# Shared search cache, created on first use so importing never touches the disk
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Get the shared SearchCache, creating it on first use."""
+    global _search_cache
+
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchCache()
+    return _search_cache
@@ -50,21 +50,38 @@ class GalleryDLDownloader:
         # Add Aria2c configuration if available and enabled
         if config.get("download.use_aria2", True) and self.aria2_available:
             base_config["downloader"] = {
-                "aria2": ARIA2_HIGH_PERFORMANCE
+                "aria2": self._get_aria2_config()
             }
         
         return base_config
     
+    def _get_aria2_config(self) -> Dict[str, Any]:
+        """Get aria2c configuration with concurrency limits from settings."""
+        # The setting defaults match the high-performance preset, so what settings show is what runs
+        overrides = {
+            "--max-concurrent-downloads": config.get("download.max_concurrent", 32),
+            "--max-connections-per-server": config.get("download.max_connections_per_server", 16),
+        }
+        
+        args = [
+            arg for arg in ARIA2_HIGH_PERFORMANCE["cmdline-args"]
+            if arg.split("=", 1)[0] not in overrides
+        ]
+        args.extend(f"{option}={value}" for option, value in overrides.items())
+        
+        return {**ARIA2_HIGH_PERFORMANCE, "cmdline-args": args}
+    
     def set_progress_callback(self, callback: Callable[[str, int, int], None]):
         """Set callback for progress updates."""
         self.progress_callback = callback
     
-    def download_gallery(self, url: str, gallery_info: Optional[GalleryInfo] = None) -> DownloadResult:
-        """Download a single gallery."""
+    def download_gallery(self, url: str, gallery_info: Optional[GalleryInfo] = None,
+                         output_dir: Optional[str] = None) -> DownloadResult:
+        """Download a single gallery, into output_dir if given instead of the configured base path."""
         try:
             # Create temporary config file
             with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                config_data = self._prepare_config(gallery_info)
+                config_data = self._prepare_config(gallery_info, output_dir)
                 json.dump(config_data, f, indent=2)
                 config_file = f.name
             
@@ -169,9 +186,14 @@ class GalleryDLDownloader:
         
         return results
     
-    def _prepare_config(self, gallery_info: Optional[GalleryInfo] = None) -> Dict[str, Any]:
+    def _prepare_config(self, gallery_info: Optional[GalleryInfo] = None,
+                        output_dir: Optional[str] = None) -> Dict[str, Any]:
         """Prepare gallery-dl config with custom settings."""
         config_data = self.base_config.copy()
+        config_data["extractor"] = dict(config_data["extractor"])
+        
+        if output_dir:
+            config_data["extractor"]["base-directory"] = output_dir
         
         # Set directory structure - use title from gallery-dl's variables if no gallery_info
         if gallery_info:
@@ -1,7 +1,7 @@
 """Base site class for manga downloading sites."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
 from dataclasses import dataclass
 import re
 
@@ -18,6 +18,21 @@ class GalleryInfo:
     description: Optional[str] = None
     thumbnail_url: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    rating: float = 0.0
+    views: int = 0
+
+
+class GallerySummary(NamedTuple):
+    """Lightweight gallery row passed from search workers to the GUI."""
+    id: str
+    title: str
+    url: str
+    artist: Optional[str]
+    pages: Optional[int]
+    tags: List[str]
+    thumbnail: Optional[str]
+    rating: float
+    views: int
 
 
 @dataclass
@@ -1,10 +1,13 @@
 """HentaiFox site implementation."""
 
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, List
 from bs4 import BeautifulSoup
 from .base import BaseSite, GalleryInfo, SearchResult
+from ..cache import get_search_cache
 
 
 class HentaiFoxSite(BaseSite):
@@ -18,6 +21,9 @@ class HentaiFoxSite(BaseSite):
         
         # Create persistent session for connection pooling
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -38,7 +44,19 @@ class HentaiFoxSite(BaseSite):
             return None
         
         try:
-            response = self.session.get(url, timeout=5)
+            # Revalidate a previously parsed page instead of downloading it again
+            headers = {}
+            cached = get_search_cache().get_http_cached(url)
+            if cached:
+                etag, last_modified, cached_info = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            response = self.session.get(url, headers=headers, timeout=5)
+            if cached and response.status_code == 304:
+                return cached_info
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -81,7 +99,7 @@ class HentaiFoxSite(BaseSite):
                 if not thumbnail_url.startswith('http'):
                     thumbnail_url = self.base_url + thumbnail_url
             
-            return GalleryInfo(
+            gallery_info = GalleryInfo(
                 id=gallery_id,
                 title=title,
                 url=url,
@@ -91,6 +109,13 @@ class HentaiFoxSite(BaseSite):
                 thumbnail_url=thumbnail_url
             )
             
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                get_search_cache().put_http_cached(url, etag, last_modified, gallery_info)
+            
+            return gallery_info
+            
         except Exception as e:
             return None
     
@@ -300,4 +325,20 @@ class HentaiFoxSite(BaseSite):
             current_page=current_page,
             total_pages=total_pages,
             has_next=has_next
-        )
\ No newline at end of file
+        )
+
+
+# One site shared by searches and downloads so they use a single session and connection pool
+_site = None
+_site_lock = threading.Lock()
+
+
+def get_site() -> HentaiFoxSite:
+    """Get the shared HentaiFoxSite, creating it on first use."""
+    global _site
+    
+    if _site is None:
+        with _site_lock:
+            if _site is None:
+                _site = HentaiFoxSite()
+    return _site
@@ -0,0 +1,113 @@
+"""Persistent on-disk cache for gallery thumbnails."""
+
+import hashlib
+import io
+import json
+import time
+import requests
+from pathlib import Path
+from typing import Optional, Tuple
+from PIL import Image, ImageOps
+
+from config.settings import config
+
+# Size thumbnails are shown at; images are stored pre-scaled to it
+THUMBNAIL_SIZE = (90, 120)
+
+
+class ThumbnailCache:
+    """Keeps thumbnail images on disk with their HTTP validators."""
+
+    def __init__(self):
+        self.cache_dir = Path(config.get("cache.thumbnail_dir", str(Path.home() / ".hfox" / "thumbnails")))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age = config.get("cache.thumbnail_max_age", 604800)
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        """Get the image and sidecar metadata paths for a URL."""
+        key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.img", self.cache_dir / f"{key}.json"
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Get cached image bytes for a URL."""
+        image_path, _ = self._paths(url)
+        try:
+            return image_path.read_bytes()
+        except OSError:
+            return None
+
+    def validators(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get the stored (etag, last_modified) for a URL."""
+        _, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return None, None
+        return meta.get("etag"), meta.get("last_modified")
+
+    def _scale(self, data: bytes) -> bytes:
+        """Crop and scale image bytes to the thumbnail size as JPEG."""
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                thumbnail = ImageOps.fit(image.convert("RGB"), THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+        except (OSError, ValueError):
+            return data
+
+        output = io.BytesIO()
+        thumbnail.save(output, "JPEG", quality=85)
+        return output.getvalue()
+
+    def put(self, url: str, data: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> bytes:
+        """Store scaled image bytes and validators for a URL, returning the stored bytes."""
+        image_path, meta_path = self._paths(url)
+        data = self._scale(data)
+        image_path.write_bytes(data)
+        meta_path.write_text(
+            json.dumps({"url": url, "etag": etag, "last_modified": last_modified}),
+            encoding='utf-8'
+        )
+        return data
+
+    def _age(self, url: str) -> float:
+        """Get the seconds since a URL's image was stored."""
+        image_path, _ = self._paths(url)
+        try:
+            return time.time() - image_path.stat().st_mtime
+        except OSError:
+            return float("inf")
+
+    def fetch(self, url: str) -> Optional[bytes]:
+        """Fetch a thumbnail, revalidating a stale cached copy with a conditional GET."""
+        cached = self.get(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified = self.validators(url)
+
+            # Fresh copies, and copies that cannot be revalidated, are used as they are
+            if not (etag or last_modified) or self._age(url) < self.max_age:
+                return cached
+
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=10)
+            if cached is not None and response.status_code == 304:
+                # Still valid; restart its max-age
+                self._paths(url)[0].touch()
+                return cached
+            response.raise_for_status()
+        except (requests.RequestException, OSError):
+            return cached
+
+        return self.put(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+
+# Global thumbnail cache instance
+thumb_cache = ThumbnailCache()
@@ -5,7 +5,6 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QPalette, QColor
 
-from gui.windows.main_window import MainWindow
 # Removed theme manager - using simple styling
 
 
@@ -38,7 +37,8 @@ class HentaiFoxDownloaderApp(QApplication):
         font = QFont("Segoe UI", 9)
         self.setFont(font)
         
-        # Create main window
+        # Create main window; its import is deferred until the application exists
+        from gui.windows.main_window import MainWindow
         self.main_window = MainWindow()
         self.main_window.show()
     
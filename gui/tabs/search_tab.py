@@ -1,15 +1,55 @@
 """Search tab for browsing and searching galleries."""
 
+import json
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
-                            QScrollArea, QLabel, QComboBox, QSpinBox, QFrame,
-                            QGridLayout, QGroupBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
+                            QListView, QLabel, QComboBox, QSpinBox, QFrame,
+                            QGroupBox, QAbstractItemView)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QFont
 
 # Removed theme manager - using simple styling
 from gui.widgets.modern_button import ModernButton
-from gui.widgets.gallery_card import GalleryCard
+from gui.widgets.gallery_list import GalleryListModel, GalleryCardDelegate
 from gui.workers.search_worker import SearchWorker
+from core.cache import get_search_cache
+from config.settings import config
+
+
+# Gallery info shared by every info dialog, preloaded from the persistent cache
+_GALLERY_INFO_CACHE = {}
+_GALLERY_INFO_LOADED = False
+
+
+class GalleryInfoRunnable(QRunnable):
+    """Gallery info lookup for the info dialog run on the shared thread pool."""
+    
+    class Signals(QObject):
+        """Signals for the runnable, which cannot define its own."""
+        
+        info_loaded = pyqtSignal(object)  # GalleryInfo
+        error_occurred = pyqtSignal(str)
+        finished = pyqtSignal()
+    
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self.signals = GalleryInfoRunnable.Signals()
+    
+    def run(self):
+        """Fetch the gallery information through the shared site session."""
+        try:
+            from core.sites.hentaifox import get_site
+            gallery_info = get_site().get_gallery_info(self.url)
+            if gallery_info:
+                self.signals.info_loaded.emit(gallery_info)
+            else:
+                self.signals.error_occurred.emit("Could not fetch gallery information")
+        except Exception as e:
+            self.signals.error_occurred.emit(str(e))
+        finally:
+            self.signals.finished.emit()
 
 
 class SearchTab(QWidget):
@@ -24,7 +64,14 @@ class SearchTab(QWidget):
         self.current_page = 1
         self.total_pages = 1
         self.search_worker = None
-        self.search_thread = None
+        self._active_jobs = set()
+        self._streamed_results = []
+        self._pending_page_key = None
+        
+        # Cached search pages keyed by query/options/page, oldest first
+        self._page_cache = OrderedDict()
+        self._page_cache_size = config.get("cache.max_search_pages", 50)
+        self.load_cache()
         
         self.setup_ui()
         self.apply_styling()
@@ -143,18 +190,29 @@ class SearchTab(QWidget):
         
         layout.addLayout(info_layout)
         
-        # Results scroll area
-        self.results_scroll = QScrollArea()
-        self.results_scroll.setWidgetResizable(True)
-        self.results_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.results_scroll.setMinimumHeight(400)
-        
-        self.results_widget = QWidget()
-        self.results_layout = QGridLayout(self.results_widget)
-        self.results_layout.setSpacing(16)
-        
-        self.results_scroll.setWidget(self.results_widget)
-        layout.addWidget(self.results_scroll)
+        # Results view; cards are painted by a delegate instead of one widget tree each
+        self.results_view = QListView()
+        self.results_view.setViewMode(QListView.ViewMode.IconMode)
+        self.results_view.setFlow(QListView.Flow.LeftToRight)
+        self.results_view.setWrapping(True)
+        self.results_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.results_view.setMovement(QListView.Movement.Static)
+        self.results_view.setUniformItemSizes(True)
+        self.results_view.setSpacing(6)
+        self.results_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.results_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.results_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.results_view.setMouseTracking(True)
+        self.results_view.setMinimumHeight(400)
+        self.results_view.setLayoutMode(QListView.LayoutMode.Batched)
+        
+        self.results_model = GalleryListModel(self)
+        self.results_delegate = GalleryCardDelegate(self.results_view)
+        self.results_delegate.download_requested.connect(self.download_requested.emit)
+        self.results_delegate.info_requested.connect(self.show_gallery_info)
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(self.results_delegate)
+        layout.addWidget(self.results_view)
         
         # Empty state
         self.empty_label = QLabel("🔍 Enter a search term to find galleries")
@@ -202,7 +260,7 @@ class SearchTab(QWidget):
                 font-weight: 500;
             }
             
-            QScrollArea {
+            QListView {
                 border: 1px solid #4B5563;
                 border-radius: 12px;
                 background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
@@ -233,6 +291,32 @@ class SearchTab(QWidget):
             }
         """)
     
+    def load_cache(self):
+        """Preload cached search pages and gallery info from disk."""
+        global _GALLERY_INFO_LOADED
+        
+        try:
+            for key, results, total_pages in get_search_cache().load_search_pages(self._page_cache_size):
+                self._page_cache[key] = (results, total_pages)
+            
+            if not _GALLERY_INFO_LOADED:
+                _GALLERY_INFO_CACHE.update(get_search_cache().load_gallery_info())
+                _GALLERY_INFO_LOADED = True
+        except Exception as e:
+            print(f"Could not load search cache: {e}")
+    
+    def cache_page(self, key: str, results, total_pages: int):
+        """Store a page of results in memory and on disk."""
+        self._page_cache[key] = (results, total_pages)
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self._page_cache_size:
+            self._page_cache.popitem(last=False)
+        
+        try:
+            get_search_cache().put_search_page(key, results, total_pages)
+        except Exception as e:
+            print(f"Could not persist search page: {e}")
+    
     def start_search(self):
         """Start searching with current parameters."""
         query = self.search_input.text().strip()
@@ -240,24 +324,18 @@ class SearchTab(QWidget):
             return
         
         self.current_page = 1
-        self.perform_search(query, self.current_page)
+        self.perform_search(query, self.current_page, delay_ms=0)
     
-    def perform_search(self, query: str, page: int):
-        """Perform search with given parameters."""
-        # Cancel existing search safely
-        try:
-            if hasattr(self, 'search_thread') and self.search_thread:
-                if self.search_thread.isRunning():
-                    if hasattr(self, 'search_worker') and self.search_worker:
-                        self.search_worker.cancel()
-                    self.search_thread.quit()
-                    self.search_thread.wait()
-        except RuntimeError:
-            # Thread was already deleted, ignore
-            pass
+    def perform_search(self, query: str, page: int, delay_ms: int = 250):
+        """Perform search with given parameters.
         
-        # Show loading state
-        self.show_loading_state()
+        Searches are debounced so rapid paging only hits the network for the last page asked for.
+        """
+        # Cancel existing search; its results are ignored if they still arrive
+        SearchWorker.cancel_scheduled()
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.search_worker = None
         
         # Create search worker
         search_options = {
@@ -267,25 +345,72 @@ class SearchTab(QWidget):
             'page': page
         }
         
-        self.search_worker = SearchWorker(query, search_options)
-        self.search_thread = QThread()
-        self.search_worker.moveToThread(self.search_thread)
+        # Serve the page from cache when we have it
+        key = json.dumps([query, search_options], sort_keys=True)
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            self._pending_page_key = None
+            self._page_cache.move_to_end(key)
+            self.on_search_completed(*cached)
+            return
+        
+        self._pending_page_key = key
         
-        # Connect signals
-        self.search_thread.started.connect(self.search_worker.start_search)
-        self.search_worker.search_completed.connect(self.on_search_completed)
-        self.search_worker.search_error.connect(self.on_search_error)
-        self.search_worker.finished.connect(self.search_thread.quit)
-        self.search_worker.finished.connect(self.search_worker.deleteLater)
-        self.search_thread.finished.connect(self.search_thread.deleteLater)
+        # Show loading state
+        self.show_loading_state()
         
-        # Start search
-        self.search_thread.start()
+        SearchWorker.schedule(query, search_options, self._attach_worker, delay_ms)
+    
+    def _attach_worker(self, worker):
+        """Make a scheduled worker the current search and connect its signals."""
+        self.search_worker = worker
+        self._streamed_results = []
+        
+        # Connect signals, always queued so the worker never runs GUI slots itself
+        signals = worker.signals
+        queued = Qt.ConnectionType.QueuedConnection
+        signals.gallery_ready.connect(lambda gallery: self._on_worker_gallery(worker, gallery), type=queued)
+        signals.search_completed.connect(
+            lambda results, total_pages: self._on_worker_completed(worker, results, total_pages), type=queued
+        )
+        signals.search_error.connect(lambda message: self._on_worker_error(worker, message), type=queued)
+        signals.finished.connect(lambda: self._active_jobs.discard(worker), type=queued)
+        
+        self._active_jobs.add(worker)
+    
+    def _on_worker_gallery(self, worker, gallery):
+        """Show a streamed gallery unless a newer search replaced the worker."""
+        if worker is not self.search_worker:
+            return
+        
+        # The first row replaces the loading state with the results view
+        if not self._streamed_results:
+            self.hide_loading_state()
+            self.clear_results()
+            self.empty_label.hide()
+            self.results_view.show()
+            self.results_view.scrollToTop()
+        
+        self._streamed_results.append(gallery)
+        self.results_model.append_gallery(gallery)
+    
+    def _on_worker_completed(self, worker, results, total_pages):
+        """Handle results unless a newer search replaced the worker."""
+        if worker is self.search_worker:
+            self.search_worker = None
+            streamed, self._streamed_results = self._streamed_results, []
+            self.on_search_completed(results or streamed, total_pages, displayed=bool(streamed))
+    
+    def _on_worker_error(self, worker, error_message):
+        """Handle an error unless a newer search replaced the worker."""
+        if worker is self.search_worker:
+            self.search_worker = None
+            self.on_search_error(error_message)
     
     def show_loading_state(self):
         """Show loading state."""
         self.empty_label.hide()
-        self.results_scroll.hide()
+        self.results_view.hide()
         self.loading_label.show()
         self.search_button.set_loading(True)
     
@@ -294,64 +419,52 @@ class SearchTab(QWidget):
         self.loading_label.hide()
         self.search_button.set_loading(False)
     
-    def on_search_completed(self, results, total_pages):
-        """Handle search completion."""
+    def on_search_completed(self, results, total_pages, displayed: bool = False):
+        """Handle search completion; displayed means the rows were already streamed in."""
         self.hide_loading_state()
         self.search_results = results
         self.total_pages = max(1, total_pages)  # Ensure at least 1 page
         
+        if results and self._pending_page_key:
+            self.cache_page(self._pending_page_key, results, total_pages)
+        self._pending_page_key = None
+        
         if results:
-            self.display_results(results)
+            if not displayed:
+                self.display_results(results)
             self.update_pagination_info()
             self.empty_label.hide()
-            self.results_scroll.show()
+            self.results_view.show()
         else:
             self.show_no_results()
     
     def on_search_error(self, error_message):
         """Handle search error."""
+        self._pending_page_key = None
         self.hide_loading_state()
         self.show_error_state(error_message)
     
     def display_results(self, results):
-        """Display search results in grid layout."""
-        # Clear existing results
-        self.clear_results()
-        
-        # Add gallery cards
-        columns = 2  # Number of columns in grid
-        for i, gallery_info in enumerate(results):
-            row = i // columns
-            col = i % columns
-            
-            card = GalleryCard(gallery_info)
-            card.download_requested.connect(self.download_requested.emit)
-            card.info_requested.connect(self.show_gallery_info)
-            
-            self.results_layout.addWidget(card, row, col)
-        
-        # Add stretch to bottom
-        self.results_layout.setRowStretch(len(results) // columns + 1, 1)
+        """Display search results as painted gallery cards."""
+        self.results_model.set_galleries(results)
+        self.results_view.scrollToTop()
     
     def clear_results(self):
-        """Clear all result widgets."""
-        while self.results_layout.count():
-            child = self.results_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        """Clear all results."""
+        self.results_model.set_galleries([])
     
     def show_no_results(self):
         """Show no results state."""
         self.empty_label.setText("😔 No galleries found for your search")
         self.empty_label.show()
-        self.results_scroll.hide()
+        self.results_view.hide()
         self.update_pagination_info()
     
     def show_error_state(self, error_message):
         """Show error state."""
         self.empty_label.setText(f"❌ Search error: {error_message}")
         self.empty_label.show()
-        self.results_scroll.hide()
+        self.results_view.hide()
     
     def update_pagination_info(self):
         """Update pagination information."""
@@ -421,7 +534,6 @@ class SearchTab(QWidget):
     def show_gallery_info(self, url: str):
         """Show detailed gallery information."""
         from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPushButton
-        from PyQt6.QtCore import QThread, QObject, pyqtSignal
         
         # Create info dialog
         dialog = QDialog(self)
@@ -497,27 +609,6 @@ class SearchTab(QWidget):
         
         layout.addLayout(button_layout)
         
-        # Worker to fetch gallery info
-        class InfoWorker(QObject):
-            info_loaded = pyqtSignal(object)
-            error_occurred = pyqtSignal(str)
-            
-            def __init__(self, url):
-                super().__init__()
-                self.url = url
-            
-            def fetch_info(self):
-                try:
-                    from core.sites.hentaifox import HentaiFoxSite
-                    site = HentaiFoxSite()
-                    gallery_info = site.get_gallery_info(self.url)
-                    if gallery_info:
-                        self.info_loaded.emit(gallery_info)
-                    else:
-                        self.error_occurred.emit("Could not fetch gallery information")
-                except Exception as e:
-                    self.error_occurred.emit(str(e))
-        
         def on_info_loaded(gallery_info):
             loading_label.hide()
             title_label.setText(gallery_info.title or "Unknown Title")
@@ -531,25 +622,34 @@ class SearchTab(QWidget):
             
             url_label.setText(f"URL: {gallery_info.url}")
             info_widget.show()
+            
+            if url not in _GALLERY_INFO_CACHE:
+                _GALLERY_INFO_CACHE[url] = gallery_info
+                try:
+                    get_search_cache().put_gallery_info(gallery_info)
+                except Exception as e:
+                    print(f"Could not persist gallery info: {e}")
         
         def on_error(error_msg):
             loading_label.setText(f"❌ Error: {error_msg}")
             loading_label.setStyleSheet("color: #ff6b6b; font-size: 14px;")
         
+        # Use cached info when available
+        cached_info = _GALLERY_INFO_CACHE.get(url)
+        if cached_info is not None:
+            on_info_loaded(cached_info)
+            dialog.exec()
+            return
+        
         # Start worker
-        worker = InfoWorker(url)
-        thread = QThread()
-        worker.moveToThread(thread)
-        
-        thread.started.connect(worker.fetch_info)
-        worker.info_loaded.connect(on_info_loaded)
-        worker.error_occurred.connect(on_error)
-        worker.info_loaded.connect(thread.quit)
-        worker.error_occurred.connect(thread.quit)
-        thread.finished.connect(thread.deleteLater)
-        worker.info_loaded.connect(worker.deleteLater)
-        worker.error_occurred.connect(worker.deleteLater)
-        
-        thread.start()
+        runnable = GalleryInfoRunnable(url)
+        signals = runnable.signals
+        queued = Qt.ConnectionType.QueuedConnection
+        signals.info_loaded.connect(on_info_loaded, type=queued)
+        signals.error_occurred.connect(on_error, type=queued)
+        signals.finished.connect(lambda: self._active_jobs.discard(runnable), type=queued)
+        
+        self._active_jobs.add(runnable)
+        QThreadPool.globalInstance().start(runnable)
         
         dialog.exec()
\ No newline at end of file
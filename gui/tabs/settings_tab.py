@@ -1,16 +1,169 @@
 """Settings tab for configuring the application."""
 
+import os
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QSpinBox, QCheckBox, QComboBox,
-                            QGroupBox, QGridLayout, QSlider, QFileDialog)
-from PyQt6.QtCore import Qt, pyqtSignal
+                            QGroupBox, QFormLayout, QSlider, QFileDialog)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont
 
 # Removed theme manager - using simple styling
 from gui.widgets.modern_button import ModernButton
+from gui.utils.fonts import get_font
+from gui.utils.qss import minify_qss
 from config.settings import config
 
 
+# Conversion format config values and their combo box labels
+_FORMAT_TO_UI = {"none": "None", "pdf": "PDF", "cbz": "CBZ"}
+_UI_TO_FORMAT = {label: fmt for fmt, label in _FORMAT_TO_UI.items()}
+
+# Setter and getter names for each bound widget type
+_ACCESSORS = {
+    QLineEdit: ("setText", "text"),
+    QSpinBox: ("setValue", "value"),
+    QSlider: ("setValue", "value"),
+    QCheckBox: ("setChecked", "isChecked"),
+}
+
+# Scoped to the tab's object name so the rules never leak into other tabs
+_SETTINGS_QSS = minify_qss("""
+    #SettingsTab QGroupBox {
+        font-weight: 600;
+        font-size: 12px;
+        border: 1px solid #4B5563;
+        border-radius: 12px;
+        margin-top: 12px;
+        padding-top: 16px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1F2937, stop:1 #111827);
+    }
+    
+    #SettingsTab QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 16px;
+        padding: 0 12px 0 12px;
+        color: #8B5CF6;
+        font-weight: 700;
+        font-size: 13px;
+    }
+    
+    #SettingsTab QLabel {
+        color: #F8FAFC;
+        font-size: 11px;
+        font-weight: 500;
+    }
+    
+    #SettingsTab QSlider::groove:horizontal {
+        border: 1px solid #4B5563;
+        height: 8px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #374151, stop:1 #1F2937);
+        border-radius: 4px;
+    }
+    
+    #SettingsTab QSlider::handle:horizontal {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #A855F7, stop:1 #8B5CF6);
+        border: 2px solid #FFFFFF;
+        width: 20px;
+        height: 20px;
+        border-radius: 10px;
+        margin: -8px 0;
+    }
+    
+    #SettingsTab QSlider::handle:horizontal:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #C084FC, stop:1 #A855F7);
+        transform: scale(1.1);
+    }
+    
+    #SettingsTab QSlider::sub-page:horizontal {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8B5CF6, stop:1 #7C3AED);
+        border-radius: 4px;
+    }
+    
+    #SettingsTab QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    #SettingsTab QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #94A3B8;
+        margin-right: 5px;
+    }
+    
+    #SettingsTab QComboBox QAbstractItemView {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1F2937, stop:1 #111827);
+        border: 1px solid #4B5563;
+        border-radius: 8px;
+        selection-background-color: #8B5CF6;
+        color: #F8FAFC;
+    }
+    
+    #SettingsTab QSpinBox::up-button, #SettingsTab QSpinBox::down-button {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4B5563, stop:1 #374151);
+        border: 1px solid #6B7280;
+        width: 16px;
+        border-radius: 4px;
+    }
+    
+    #SettingsTab QSpinBox::up-button:hover, #SettingsTab QSpinBox::down-button:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #6B7280, stop:1 #4B5563);
+    }
+    
+    #SettingsTab QSpinBox::up-arrow {
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-bottom: 4px solid #94A3B8;
+    }
+    
+    #SettingsTab QSpinBox::down-arrow {
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 4px solid #94A3B8;
+    }
+""")
+
+
+def _line_edit(placeholder: str = "") -> QLineEdit:
+    """Create a line edit with placeholder text."""
+    line_edit = QLineEdit()
+    line_edit.setPlaceholderText(placeholder)
+    return line_edit
+
+
+def _spin_box(minimum: int, maximum: int, step: int = 1, suffix: str = "") -> QSpinBox:
+    """Create a spin box with the given range."""
+    spin_box = QSpinBox()
+    spin_box.setRange(minimum, maximum)
+    spin_box.setSingleStep(step)
+    spin_box.setSuffix(suffix)
+    return spin_box
+
+
+def _combo_box(items) -> QComboBox:
+    """Create a combo box with the given items."""
+    combo_box = QComboBox()
+    combo_box.addItems(items)
+    return combo_box
+
+
+def _slider(minimum: int, maximum: int, value: int) -> QSlider:
+    """Create a horizontal slider."""
+    slider = QSlider(Qt.Orientation.Horizontal)
+    slider.setRange(minimum, maximum)
+    slider.setValue(value)
+    return slider
+
+
 class SettingsTab(QWidget):
     """Settings tab for application configuration."""
     
@@ -20,168 +173,144 @@ class SettingsTab(QWidget):
         super().__init__(parent)
         # Using simple black theme
         
-        self.setup_ui()
-        self.apply_styling()
-        self.load_settings()
+        # Widgets are built on first show to keep startup fast
+        self._built = False
+        self._loaded_values = None
+        self._dir_dialog = None
+    
+    def showEvent(self, event):
+        """Build the tab the first time it is shown."""
+        if not self._built:
+            self.setup_ui()
+            self.apply_styling()
+            self.load_settings()
+            self._built = True
+        super().showEvent(event)
     
     def setup_ui(self):
         """Setup the settings tab UI."""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(20)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Header
-        header_label = QLabel("⚙️ Settings")
-        header_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        header_label.setStyleSheet("color: #ffffff;")
-        layout.addWidget(header_label)
-        
-        # Download settings
-        self.setup_download_settings(layout)
-        
-        # Performance settings
-        self.setup_performance_settings(layout)
-        
-        # Conversion settings
-        self.setup_conversion_settings(layout)
-        
-        # Interface settings
-        self.setup_interface_settings(layout)
-        
-        # Action buttons
-        self.setup_action_buttons(layout)
-        
-        layout.addStretch()
+        # Build every group before the first repaint
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout(self)
+            layout.setSpacing(20)
+            layout.setContentsMargins(20, 20, 20, 20)
+            
+            # Header
+            header_label = QLabel("⚙️ Settings")
+            header_label.setFont(get_font("Segoe UI", 16, QFont.Weight.Bold))
+            header_label.setStyleSheet("color: #ffffff;")
+            layout.addWidget(header_label)
+            
+            # Download settings
+            self.setup_download_settings(layout)
+            
+            # Performance settings
+            self.setup_performance_settings(layout)
+            
+            # Conversion settings
+            self.setup_conversion_settings(layout)
+            
+            # Interface settings
+            self.setup_interface_settings(layout)
+            
+            # Action buttons
+            self.setup_action_buttons(layout)
+            
+            layout.addStretch()
+            
+            self._bind_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _add_rows(self, layout, rows):
+        """Add (label, attr, factory[, extra_label, extra_attr, extra_factory]) rows to a form."""
+        for label, attr, factory, *extra in rows:
+            field = factory()
+            setattr(self, attr, field)
+            
+            # A second widget shares the row through a horizontal field layout
+            if extra:
+                extra_label, extra_attr, extra_factory = extra
+                extra_widget = extra_factory()
+                setattr(self, extra_attr, extra_widget)
+                
+                widget = field
+                field = QHBoxLayout()
+                field.addWidget(widget)
+                if extra_label:
+                    field.addWidget(QLabel(extra_label))
+                field.addWidget(extra_widget)
+            
+            if label:
+                layout.addRow(label, field)
+            else:
+                layout.addRow(field)
     
     def setup_download_settings(self, parent_layout):
         """Setup download settings section."""
         group = QGroupBox("Download Settings")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        layout = QGridLayout(group)
+        group.setFont(get_font("Segoe UI", 10, QFont.Weight.Medium))
+        layout = QFormLayout(group)
         layout.setSpacing(12)
         
-        # Base download path
-        layout.addWidget(QLabel("Download Directory:"), 0, 0)
-        self.download_path_input = QLineEdit()
-        layout.addWidget(self.download_path_input, 0, 1)
-        
-        browse_button = ModernButton("Browse")
-        browse_button.clicked.connect(self.browse_download_directory)
-        layout.addWidget(browse_button, 0, 2)
-        
-        # Folder template
-        layout.addWidget(QLabel("Folder Template:"), 1, 0)
-        self.folder_template_input = QLineEdit()
-        self.folder_template_input.setPlaceholderText("{title}")
-        layout.addWidget(self.folder_template_input, 1, 1, 1, 2)
+        self._add_rows(layout, [
+            ("Download Directory:", "download_path_input", QLineEdit,
+             None, "browse_button", lambda: ModernButton("Browse")),
+            ("Folder Template:", "folder_template_input", lambda: _line_edit("{title}")),
+            ("Filename Template:", "filename_template_input", lambda: _line_edit("{page:03d}.{ext}")),
+            ("Max Concurrent Downloads:", "max_concurrent_spin", lambda: _spin_box(1, 32),
+             "Retry Attempts:", "retry_attempts_spin", lambda: _spin_box(0, 10)),
+            (None, "create_subfolders_check", lambda: QCheckBox("Create subfolders")),
+        ])
         
-        # Filename template
-        layout.addWidget(QLabel("Filename Template:"), 2, 0)
-        self.filename_template_input = QLineEdit()
-        self.filename_template_input.setPlaceholderText("{page:03d}.{ext}")
-        layout.addWidget(self.filename_template_input, 2, 1, 1, 2)
-        
-        # Max concurrent downloads
-        layout.addWidget(QLabel("Max Concurrent Downloads:"), 3, 0)
-        self.max_concurrent_spin = QSpinBox()
-        self.max_concurrent_spin.setRange(1, 20)
-        layout.addWidget(self.max_concurrent_spin, 3, 1)
-        
-        # Retry attempts
-        layout.addWidget(QLabel("Retry Attempts:"), 3, 2)
-        self.retry_attempts_spin = QSpinBox()
-        self.retry_attempts_spin.setRange(0, 10)
-        layout.addWidget(self.retry_attempts_spin, 3, 3)
-        
-        # Checkboxes
-        self.create_subfolders_check = QCheckBox("Create subfolders")
-        layout.addWidget(self.create_subfolders_check, 4, 0)
+        self.browse_button.clicked.connect(self.browse_download_directory)
         
         parent_layout.addWidget(group)
     
     def setup_performance_settings(self, parent_layout):
         """Setup performance settings section."""
         group = QGroupBox("Performance Settings")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        layout = QGridLayout(group)
+        group.setFont(get_font("Segoe UI", 10, QFont.Weight.Medium))
+        layout = QFormLayout(group)
         layout.setSpacing(12)
         
-        # Use Aria2c
-        self.use_aria2_check = QCheckBox("Use Aria2c for faster downloads")
-        layout.addWidget(self.use_aria2_check, 0, 0, 1, 2)
-        
-        # Aria2c path
-        layout.addWidget(QLabel("Aria2c Path:"), 1, 0)
-        self.aria2_path_input = QLineEdit()
-        self.aria2_path_input.setPlaceholderText("aria2c")
-        layout.addWidget(self.aria2_path_input, 1, 1)
+        self._add_rows(layout, [
+            (None, "use_aria2_check", lambda: QCheckBox("Use Aria2c for faster downloads")),
+            ("Aria2c Path:", "aria2_path_input", lambda: _line_edit("aria2c")),
+            ("Max Connections per Server:", "max_connections_spin", lambda: _spin_box(1, 16),
+             "Max Parallel Galleries:", "max_parallel_spin", lambda: _spin_box(1, 10)),
+            (None, "turbo_mode_check", lambda: QCheckBox("Enable Turbo Mode (maximum speed)")),
+        ])
         
-        # Max connections per server
-        layout.addWidget(QLabel("Max Connections per Server:"), 2, 0)
-        self.max_connections_spin = QSpinBox()
-        self.max_connections_spin.setRange(1, 16)
-        layout.addWidget(self.max_connections_spin, 2, 1)
-        
-        # Max parallel galleries
-        layout.addWidget(QLabel("Max Parallel Galleries:"), 2, 2)
-        self.max_parallel_spin = QSpinBox()
-        self.max_parallel_spin.setRange(1, 10)
-        layout.addWidget(self.max_parallel_spin, 2, 3)
-        
-        # Turbo mode
-        self.turbo_mode_check = QCheckBox("Enable Turbo Mode (maximum speed)")
         self.turbo_mode_check.toggled.connect(self.on_turbo_mode_toggled)
-        layout.addWidget(self.turbo_mode_check, 3, 0, 1, 2)
         
         parent_layout.addWidget(group)
     
     def setup_conversion_settings(self, parent_layout):
         """Setup conversion settings section."""
         group = QGroupBox("Conversion Settings")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        layout = QGridLayout(group)
+        group.setFont(get_font("Segoe UI", 10, QFont.Weight.Medium))
+        layout = QFormLayout(group)
         layout.setSpacing(12)
         
-        # Auto convert
-        self.auto_convert_check = QCheckBox("Auto-convert after download")
-        layout.addWidget(self.auto_convert_check, 0, 0)
-        
-        # Default format
-        layout.addWidget(QLabel("Default Format:"), 0, 1)
-        self.default_format_combo = QComboBox()
-        self.default_format_combo.addItems(["None", "PDF", "CBZ"])
-        layout.addWidget(self.default_format_combo, 0, 2)
-        
-        # PDF quality
-        layout.addWidget(QLabel("PDF Quality:"), 1, 0)
-        self.pdf_quality_slider = QSlider(Qt.Orientation.Horizontal)
-        self.pdf_quality_slider.setRange(1, 100)
-        self.pdf_quality_slider.setValue(95)
-        layout.addWidget(self.pdf_quality_slider, 1, 1)
-        
-        self.pdf_quality_label = QLabel("95%")
-        self.pdf_quality_slider.valueChanged.connect(
-            lambda v: self.pdf_quality_label.setText(f"{v}%")
-        )
-        layout.addWidget(self.pdf_quality_label, 1, 2)
-        
-        # Max image width
-        layout.addWidget(QLabel("Max Image Width:"), 2, 0)
-        self.max_width_spin = QSpinBox()
-        self.max_width_spin.setRange(512, 4096)
-        self.max_width_spin.setSingleStep(256)
-        self.max_width_spin.setSuffix("px")
-        layout.addWidget(self.max_width_spin, 2, 1)
-        
-        # CBZ compression
-        layout.addWidget(QLabel("CBZ Compression:"), 2, 2)
-        self.cbz_compression_spin = QSpinBox()
-        self.cbz_compression_spin.setRange(0, 9)
-        layout.addWidget(self.cbz_compression_spin, 2, 3)
-        
-        # Delete source after conversion
-        self.delete_source_check = QCheckBox("Delete source images after conversion")
-        layout.addWidget(self.delete_source_check, 3, 0, 1, 2)
+        self._add_rows(layout, [
+            (None, "auto_convert_check", lambda: QCheckBox("Auto-convert after download"),
+             "Default Format:", "default_format_combo", lambda: _combo_box(list(_FORMAT_TO_UI.values()))),
+            ("PDF Quality:", "pdf_quality_slider", lambda: _slider(1, 100, 95),
+             None, "pdf_quality_label", lambda: QLabel("95%")),
+            ("Max Image Width:", "max_width_spin", lambda: _spin_box(512, 4096, 256, "px"),
+             "CBZ Compression:", "cbz_compression_spin", lambda: _spin_box(0, 9)),
+            (None, "delete_source_check", lambda: QCheckBox("Delete source images after conversion")),
+        ])
+        
+        # Coalesce label updates while the slider is dragged
+        self._pending_quality = 95
+        self._quality_timer = QTimer(self)
+        self._quality_timer.setSingleShot(True)
+        self._quality_timer.setInterval(30)
+        self._quality_timer.timeout.connect(self.update_quality_label)
+        self.pdf_quality_slider.valueChanged.connect(self.on_quality_changed)
         
         parent_layout.addWidget(group)
     
@@ -220,186 +349,99 @@ class SettingsTab(QWidget):
     
     def apply_styling(self):
         """Apply beautiful modern styling."""
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: 600;
-                font-size: 12px;
-                border: 1px solid #4B5563;
-                border-radius: 12px;
-                margin-top: 12px;
-                padding-top: 16px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1F2937, stop:1 #111827);
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 16px;
-                padding: 0 12px 0 12px;
-                color: #8B5CF6;
-                font-weight: 700;
-                font-size: 13px;
-            }
-            
-            QLabel {
-                color: #F8FAFC;
-                font-size: 11px;
-                font-weight: 500;
-            }
-            
-            QSlider::groove:horizontal {
-                border: 1px solid #4B5563;
-                height: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #374151, stop:1 #1F2937);
-                border-radius: 4px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #A855F7, stop:1 #8B5CF6);
-                border: 2px solid #FFFFFF;
-                width: 20px;
-                height: 20px;
-                border-radius: 10px;
-                margin: -8px 0;
-            }
-            
-            QSlider::handle:horizontal:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #C084FC, stop:1 #A855F7);
-                transform: scale(1.1);
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8B5CF6, stop:1 #7C3AED);
-                border-radius: 4px;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #94A3B8;
-                margin-right: 5px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1F2937, stop:1 #111827);
-                border: 1px solid #4B5563;
-                border-radius: 8px;
-                selection-background-color: #8B5CF6;
-                color: #F8FAFC;
-            }
-            
-            QSpinBox::up-button, QSpinBox::down-button {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4B5563, stop:1 #374151);
-                border: 1px solid #6B7280;
-                width: 16px;
-                border-radius: 4px;
-            }
-            
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6B7280, stop:1 #4B5563);
-            }
+        # Re-setting an identical sheet still forces a full re-polish
+        if self.styleSheet() == _SETTINGS_QSS:
+            return
+        self.setObjectName("SettingsTab")
+        self.setStyleSheet(_SETTINGS_QSS)
+    
+    def _bind_widgets(self):
+        """Pair each plain value widget with its config key and default."""
+        self._bindings = [
+            # Download settings
+            (self.download_path_input, "download.base_path", ""),
+            (self.folder_template_input, "download.folder_template", "{title}"),
+            (self.filename_template_input, "download.filename_template", "{page:03d}.{ext}"),
+            (self.max_concurrent_spin, "download.max_concurrent", 32),
+            (self.retry_attempts_spin, "download.retry_attempts", 3),
+            (self.create_subfolders_check, "download.create_subfolders", True),
             
-            QSpinBox::up-arrow {
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-bottom: 4px solid #94A3B8;
-            }
+            # Performance settings
+            (self.use_aria2_check, "download.use_aria2", True),
+            (self.aria2_path_input, "download.aria2_path", "aria2c"),
+            (self.max_connections_spin, "download.max_connections_per_server", 16),
+            (self.max_parallel_spin, "download.max_parallel_galleries", 3),
             
-            QSpinBox::down-arrow {
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #94A3B8;
-            }
-        """)
+            # Conversion settings
+            (self.auto_convert_check, "conversion.auto_convert", False),
+            (self.pdf_quality_slider, "conversion.pdf_quality", 95),
+            (self.max_width_spin, "conversion.max_image_width", 2048),
+            (self.cbz_compression_spin, "conversion.cbz_compression", 6),
+            (self.delete_source_check, "conversion.delete_source_after_conversion", False),
+        ]
     
     def load_settings(self):
         """Load current settings into the UI."""
-        # Download settings
-        self.download_path_input.setText(config.get("download.base_path", ""))
-        self.folder_template_input.setText(config.get("download.folder_template", "{title}"))
-        self.filename_template_input.setText(config.get("download.filename_template", "{page:03d}.{ext}"))
-        self.max_concurrent_spin.setValue(config.get("download.max_concurrent", 8))
-        self.retry_attempts_spin.setValue(config.get("download.retry_attempts", 3))
-        self.create_subfolders_check.setChecked(config.get("download.create_subfolders", True))
-        
-        # Performance settings
-        self.use_aria2_check.setChecked(config.get("download.use_aria2", True))
-        self.aria2_path_input.setText(config.get("download.aria2_path", "aria2c"))
-        self.max_connections_spin.setValue(config.get("download.max_connections_per_server", 8))
-        self.max_parallel_spin.setValue(config.get("download.max_parallel_galleries", 3))
-        
-        # Check if turbo mode is active (4+ parallel galleries and 8+ connections)
-        is_turbo = (config.get("download.max_parallel_galleries", 3) >= 4 and 
-                   config.get("download.max_connections_per_server", 8) >= 8)
-        self.turbo_mode_check.setChecked(is_turbo)
-        self.on_turbo_mode_toggled(is_turbo)  # Set initial state
-        
-        # Conversion settings
-        self.auto_convert_check.setChecked(config.get("conversion.auto_convert", False))
-        default_format = config.get("conversion.default_format", "none").title()
-        if default_format == "None":
-            default_format = "None"
-        self.default_format_combo.setCurrentText(default_format)
-        self.pdf_quality_slider.setValue(config.get("conversion.pdf_quality", 95))
-        self.max_width_spin.setValue(config.get("conversion.max_image_width", 2048))
-        self.cbz_compression_spin.setValue(config.get("conversion.cbz_compression", 6))
-        self.delete_source_check.setChecked(config.get("conversion.delete_source_after_conversion", False))
+        config.reload()
+        self.apply_values(config.snapshot())
+    
+    def apply_values(self, values: dict):
+        """Show flat config values in the widgets."""
+        # Programmatic updates should not fire change signals
+        with QSignalBlocker(self.turbo_mode_check), \
+                QSignalBlocker(self.max_connections_spin), \
+                QSignalBlocker(self.max_parallel_spin), \
+                QSignalBlocker(self.pdf_quality_slider):
+            for widget, key, default in self._bindings:
+                setter = _ACCESSORS[type(widget)][0]
+                getattr(widget, setter)(values.get(key, default))
+            
+            self.default_format_combo.setCurrentText(
+                _FORMAT_TO_UI.get(values.get("conversion.default_format", "none"), "None")
+            )
+            self.pdf_quality_label.setText(f"{self.pdf_quality_slider.value()}%")
+            
+            # Remember the stored values, before turbo mode adjusts them, so only an unchanged save is skipped
+            self._loaded_values = self.get_settings_values()
+            
+            # Check if turbo mode is active (4+ parallel galleries and 8+ connections)
+            is_turbo = self.max_parallel_spin.value() >= 4 and self.max_connections_spin.value() >= 8
+            self.turbo_mode_check.setChecked(is_turbo)
+            self.on_turbo_mode_toggled(is_turbo)  # Set initial state
         
         # Interface settings removed - using defaults
     
+    def get_settings_values(self) -> dict:
+        """Collect the current UI values keyed by config path."""
+        values = {
+            key: getattr(widget, _ACCESSORS[type(widget)][1])()
+            for widget, key, _ in self._bindings
+        }
+        values["conversion.default_format"] = _UI_TO_FORMAT[self.default_format_combo.currentText()]
+        return values
+    
     def save_settings(self):
         """Save current settings."""
         try:
-            # Download settings
-            config.set("download.base_path", self.download_path_input.text())
-            config.set("download.folder_template", self.folder_template_input.text())
-            config.set("download.filename_template", self.filename_template_input.text())
-            config.set("download.max_concurrent", self.max_concurrent_spin.value())
-            config.set("download.retry_attempts", self.retry_attempts_spin.value())
-            config.set("download.create_subfolders", self.create_subfolders_check.isChecked())
-            
-            # Performance settings
-            config.set("download.use_aria2", self.use_aria2_check.isChecked())
-            config.set("download.aria2_path", self.aria2_path_input.text())
-            
             # Handle turbo mode
             if self.turbo_mode_check.isChecked():
-                # Enable turbo mode settings
-                config.set("download.max_connections_per_server", 16)
-                config.set("download.max_parallel_galleries", 4)
                 # Update UI to reflect turbo values
                 self.max_connections_spin.setValue(16)
                 self.max_parallel_spin.setValue(4)
-            else:
-                # Use manual settings
-                config.set("download.max_connections_per_server", self.max_connections_spin.value())
-                config.set("download.max_parallel_galleries", self.max_parallel_spin.value())
             
-            # Conversion settings
-            config.set("conversion.auto_convert", self.auto_convert_check.isChecked())
-            config.set("conversion.default_format", self.default_format_combo.currentText().lower())
-            config.set("conversion.pdf_quality", self.pdf_quality_slider.value())
-            config.set("conversion.max_image_width", self.max_width_spin.value())
-            config.set("conversion.cbz_compression", self.cbz_compression_spin.value())
-            config.set("conversion.delete_source_after_conversion", self.delete_source_check.isChecked())
+            values = self.get_settings_values()
             
             # Interface settings removed - using defaults
             
-            # Save to file
-            config.save()
+            # Nothing to write if the values match what was loaded
+            if values == self._loaded_values:
+                self.save_button.set_success(2000)
+                return
+            
+            # Apply and save to file in one write
+            with config.batch():
+                config.update(values)
+            self._loaded_values = values
             
             self.save_button.set_success(2000)
             self.settings_changed.emit()
@@ -420,34 +462,56 @@ class SettingsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            config.reset_to_defaults()
-            self.load_settings()
+            self.apply_values(config.reset_to_defaults())
             self.reset_button.set_success(2000)
     
     def test_system(self):
         """Test system components."""
-        self.test_button.set_loading(True)
-        
         # This would run system tests similar to CLI test command
-        # For now, just simulate success
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(2000, lambda: self.test_button.set_success(2000))
+        # For now, report success without an artificial delay
+        self.test_button.set_success(2000)
     
     def browse_download_directory(self):
         """Browse for download directory."""
-        directory = QFileDialog.getExistingDirectory(
-            self, "Select Download Directory"
-        )
+        dialog = self._get_dir_dialog()
+        dialog.setDirectory(self.download_path_input.text() or os.path.expanduser("~"))
         
-        if directory:
-            self.download_path_input.setText(directory)
+        if dialog.exec():
+            directories = dialog.selectedFiles()
+            if directories:
+                self.download_path_input.setText(directories[0])
+    
+    def _get_dir_dialog(self) -> QFileDialog:
+        """Get the directory picker, creating it on first use."""
+        if self._dir_dialog is None:
+            dialog = QFileDialog(self, "Select Download Directory")
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            dialog.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+            dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+            # Qt's own dialog avoids the native picker's stat() of every entry
+            dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+            dialog.setOption(QFileDialog.Option.ReadOnly, True)
+            dialog.setOption(QFileDialog.Option.HideNameFilterDetails, True)
+            self._dir_dialog = dialog
+        return self._dir_dialog
+    
+    def on_quality_changed(self, value: int):
+        """Queue a PDF quality label update."""
+        self._pending_quality = value
+        self._quality_timer.start()
+    
+    def update_quality_label(self):
+        """Show the latest PDF quality value."""
+        self.pdf_quality_label.setText(f"{self._pending_quality}%")
     
     def on_turbo_mode_toggled(self, checked: bool):
         """Handle turbo mode toggle."""
         if checked:
             # Disable manual controls and set turbo values
-            self.max_connections_spin.setValue(16)
-            self.max_parallel_spin.setValue(4)
+            with QSignalBlocker(self.max_connections_spin), QSignalBlocker(self.max_parallel_spin):
+                self.max_connections_spin.setValue(16)
+                self.max_parallel_spin.setValue(4)
             self.max_connections_spin.setEnabled(False)
             self.max_parallel_spin.setEnabled(False)
         else:
@@ -1,14 +1,25 @@
 """Simplified download tab without complex threading."""
 
+import time
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
                             QLabel, QCheckBox, QComboBox, QSpinBox, QGroupBox, 
-                            QGridLayout, QTextEdit, QPushButton)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject
-from PyQt6.QtGui import QFont
+                            QGridLayout, QTextEdit, QPushButton, QApplication,
+                            QFileDialog)
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
+from PyQt6.QtGui import QFont, QTextCursor
 
 # Removed theme manager - using simple black theme
 from gui.widgets.modern_button import ModernButton
 from config.settings import config
+from core.sites.hentaifox import get_site
+from core.downloader import GalleryDLDownloader
+from core.converter import converter
+from core.history import history
+
+# Downloads get their own pool so they never starve searches and URL tests
+_download_pool = QThreadPool()
+_download_pool.setMaxThreadCount(config.get("download.max_parallel_galleries", 3))
 
 
 class SimpleDownloadTab(QWidget):
@@ -19,6 +30,19 @@ class SimpleDownloadTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Keep pool jobs referenced until they finish
+        self._active_jobs = set()
+        
+        # Gallery info from Test URL, reused by the next download of that URL
+        self._info_cache = {}
+        
+        # Status lines are buffered and written to the log in one insert
+        self._status_buffer = []
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(30)
+        self._status_timer.timeout.connect(self.flush_status)
+        
         self.setup_ui()
         self.apply_simple_styling()
     
@@ -137,6 +161,9 @@ class SimpleDownloadTab(QWidget):
         self.status_text.setMaximumHeight(150)
         self.status_text.setReadOnly(True)
         self.status_text.setPlainText("Ready to download...")
+        # Read-only log: keep a bounded window and no undo history
+        self.status_text.document().setMaximumBlockCount(500)
+        self.status_text.setUndoRedoEnabled(False)
         layout.addWidget(self.status_text)
         
         # Control buttons
@@ -266,40 +293,64 @@ class SimpleDownloadTab(QWidget):
         self.test_button.set_loading(True)
         
         # Test URL using actual site validation
-        try:
-            from core.sites.hentaifox import HentaiFoxSite
-            
-            site = HentaiFoxSite()
-            if site.is_valid_url(url):
-                self.add_status(f"✅ URL format is valid")
-                
-                # Try to get gallery info
-                gallery_info = site.get_gallery_info(url)
-                if gallery_info:
-                    self.add_status(f"✅ Gallery found: {gallery_info.title}")
-                    self.add_status(f"📄 Pages: {gallery_info.pages}")
-                    if gallery_info.artist:
-                        self.add_status(f"👨‍🎨 Artist: {gallery_info.artist}")
-                    self.test_button.set_success(2000)
-                else:
-                    self.add_status("❌ Could not fetch gallery information")
-                    self.test_button.set_error(2000)
-            else:
-                self.add_status(f"❌ Invalid HentaiFox URL format")
-                self.test_button.set_error(2000)
-                
-        except Exception as e:
-            self.add_status(f"❌ Error testing URL: {str(e)}")
+        if not get_site().is_valid_url(url):
+            self.add_status(f"❌ Invalid HentaiFox URL format")
+            self.test_button.set_error(2000)
+            return
+        
+        self.add_status(f"✅ URL format is valid")
+        
+        # Fetch gallery info off the GUI thread
+        runnable = TestUrlRunnable(get_site(), url)
+        runnable.signals.valid.connect(lambda info: self.on_test_url_result(url, info))
+        runnable.signals.error.connect(self.on_test_url_error)
+        runnable.signals.finished.connect(lambda: self._active_jobs.discard(runnable))
+        
+        self._active_jobs.add(runnable)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def on_test_url_result(self, url: str, gallery_info):
+        """Show the gallery info found for a tested URL."""
+        if gallery_info:
+            self._info_cache[url] = gallery_info
+            self.add_status(f"✅ Gallery found: {gallery_info.title}")
+            self.add_status(f"📄 Pages: {gallery_info.pages}")
+            if gallery_info.artist:
+                self.add_status(f"👨‍🎨 Artist: {gallery_info.artist}")
+            self.test_button.set_success(2000)
+        else:
+            self.add_status("❌ Could not fetch gallery information")
             self.test_button.set_error(2000)
     
+    def on_test_url_error(self, error_msg: str):
+        """Handle an error while testing a URL."""
+        self.add_status(f"❌ Error testing URL: {error_msg}")
+        self.test_button.set_error(2000)
+    
     def add_status(self, message):
         """Add status message."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.status_text.append(f"[{timestamp}] {message}")
+        timestamp = time.strftime("%H:%M:%S")
+        # Workers may send several lines in one batched message
+        self._status_buffer.extend(f"\n[{timestamp}] {line}" for line in message.split("\n"))
+        self._status_timer.start()
+    
+    def flush_status(self):
+        """Write buffered status messages to the log."""
+        if not self._status_buffer:
+            return
+        
+        cursor = QTextCursor(self.status_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText("".join(self._status_buffer))
+        self._status_buffer.clear()
+        
+        scroll_bar = self.status_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
     
     def clear_status(self):
         """Clear status text."""
+        self._status_buffer.clear()
+        self._status_timer.stop()
         self.status_text.clear()
         self.status_text.setPlainText("Ready to download...")
     
@@ -309,8 +360,6 @@ class SimpleDownloadTab(QWidget):
     
     def paste_from_clipboard(self):
         """Paste URL from clipboard."""
-        from PyQt6.QtWidgets import QApplication
-        
         clipboard = QApplication.clipboard()
         text = clipboard.text().strip()
         
@@ -320,8 +369,6 @@ class SimpleDownloadTab(QWidget):
     
     def browse_output_directory(self):
         """Browse for output directory."""
-        from PyQt6.QtWidgets import QFileDialog
-        
         directory = QFileDialog.getExistingDirectory(
             self, "Select Output Directory"
         )
@@ -331,26 +378,22 @@ class SimpleDownloadTab(QWidget):
             self.add_status(f"📁 Output directory set: {directory}")
     
     def start_threaded_download(self, url: str):
-        """Start download in a separate thread to avoid GUI hanging."""
-        # Create worker and thread
-        self.download_worker = SimpleDownloadWorker(url, self.get_download_options())
-        self.download_thread = QThread()
-        self.download_worker.moveToThread(self.download_thread)
+        """Start download on the download pool to avoid GUI hanging."""
+        runnable = DownloadRunnable(url, self.get_download_options(), self._info_cache.get(url))
         
         # Connect signals
-        self.download_thread.started.connect(self.download_worker.run)
-        self.download_worker.status_update.connect(self.add_status)
-        self.download_worker.download_complete.connect(self.on_download_complete)
-        self.download_worker.download_error.connect(self.on_download_error)
-        self.download_worker.finished.connect(self.download_thread.quit)
-        self.download_worker.finished.connect(self.download_worker.deleteLater)
-        self.download_thread.finished.connect(self.download_thread.deleteLater)
-        
-        # Start thread
-        self.download_thread.start()
+        signals = runnable.signals
+        signals.status_update.connect(self.add_status)
+        signals.download_complete.connect(self.on_download_complete)
+        signals.download_error.connect(self.on_download_error)
+        signals.finished.connect(lambda: self._active_jobs.discard(runnable))
+        
+        self._active_jobs.add(runnable)
+        _download_pool.start(runnable)
     
     def on_download_complete(self, url: str):
         """Handle download completion."""
+        self._info_cache.pop(url, None)
         self.download_button.set_success(2000)
         self.download_completed.emit(url)
         self.url_input.clear()
@@ -368,75 +411,101 @@ class SimpleDownloadTab(QWidget):
     def refresh_settings(self):
         """Refresh settings from config."""
         self.delete_images_check.setChecked(config.get("conversion.delete_source_after_conversion", False))
+        
+        # Running downloads finish; the new limit applies to queued and later ones
+        _download_pool.setMaxThreadCount(config.get("download.max_parallel_galleries", 3))
 
 
-class SimpleDownloadWorker(QObject):
-    """Simple worker for downloading in background thread."""
+class TestUrlRunnable(QRunnable):
+    """Gallery info lookup for Test URL run on the shared thread pool."""
     
-    status_update = pyqtSignal(str)
-    download_complete = pyqtSignal(str)
-    download_error = pyqtSignal(str)
-    finished = pyqtSignal()
+    class Signals(QObject):
+        """Signals for the runnable, which cannot define its own."""
+        
+        valid = pyqtSignal(object)  # GalleryInfo or None
+        error = pyqtSignal(str)
+        finished = pyqtSignal()
+    
+    def __init__(self, site, url: str):
+        super().__init__()
+        self.site = site
+        self.url = url
+        self.signals = TestUrlRunnable.Signals()
+    
+    def run(self):
+        """Fetch the gallery information."""
+        try:
+            self.signals.valid.emit(self.site.get_gallery_info(self.url))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+class DownloadRunnable(QRunnable):
+    """Download job run on the download thread pool."""
+    
+    class Signals(QObject):
+        """Signals for the runnable, which cannot define its own."""
+        
+        status_update = pyqtSignal(str)
+        download_complete = pyqtSignal(str)
+        download_error = pyqtSignal(str)
+        finished = pyqtSignal()
     
-    def __init__(self, url: str, options: dict):
+    def __init__(self, url: str, options: dict, prefetched_info=None):
         super().__init__()
         self.url = url
         self.options = options
+        self.prefetched_info = prefetched_info
+        self.signals = DownloadRunnable.Signals()
+        
+        # Status lines are sent to the GUI in batches
+        self._pending_status = []
+        self._last_flush = time.monotonic()
     
     def run(self):
         """Run the download process."""
         try:
-            from core.sites.hentaifox import HentaiFoxSite
-            from core.downloader import GalleryDLDownloader
-            from core.converter import converter
-            from core.history import history
-            
             # Validate URL
-            site = HentaiFoxSite()
+            site = get_site()
             if not site.is_valid_url(self.url):
-                self.status_update.emit(f"❌ Invalid HentaiFox URL: {self.url}")
-                self.download_error.emit("Invalid URL")
-                self.finished.emit()
+                self._report(f"❌ Invalid HentaiFox URL: {self.url}")
+                self._flush_status()
+                self.signals.download_error.emit("Invalid URL")
                 return
             
-            self.status_update.emit("🔍 Fetching gallery information...")
+            self._report("🔍 Fetching gallery information...")
+            self._flush_status()
             
             # Get gallery info
-            gallery_info = site.get_gallery_info(self.url)
+            gallery_info = self.prefetched_info or site.get_gallery_info(self.url)
             if not gallery_info:
-                self.status_update.emit("❌ Could not fetch gallery information")
-                self.download_error.emit("Could not fetch gallery info")
-                self.finished.emit()
+                self._report("❌ Could not fetch gallery information")
+                self._flush_status()
+                self.signals.download_error.emit("Could not fetch gallery info")
                 return
             
-            self.status_update.emit(f"📖 Found: {gallery_info.title}")
-            self.status_update.emit(f"📄 Pages: {gallery_info.pages}")
+            self._report(f"📖 Found: {gallery_info.title}")
+            self._report(f"📄 Pages: {gallery_info.pages}")
             
             # Setup downloader
             downloader = GalleryDLDownloader()
             
-            # Set output directory if specified
-            if self.options.get('output_dir'):
-                from config.settings import config
-                original_path = config.get("download.base_path")
-                config.set("download.base_path", self.options.get('output_dir'))
-            
-            self.status_update.emit("⬇️ Starting download...")
-            
-            # Perform download
-            result = downloader.download_gallery(self.url, gallery_info)
+            self._report("⬇️ Starting download...")
+            self._flush_status()
             
-            # Restore original path if changed
-            if self.options.get('output_dir'):
-                config.set("download.base_path", original_path)
+            # Perform download; the output directory is per job, never written to the shared config
+            result = downloader.download_gallery(self.url, gallery_info, self.options.get('output_dir'))
             
             if result.success:
-                self.status_update.emit(f"✅ Download completed: {result.files_downloaded} files")
+                self._report(f"✅ Download completed: {result.files_downloaded} files")
                 
                 # Handle conversion if requested
                 convert_to = self.options.get('convert_to')
                 if convert_to and convert_to != 'none':
-                    self.status_update.emit(f"🔄 Converting to {convert_to.upper()}...")
+                    self._report(f"🔄 Converting to {convert_to.upper()}...")
+                    self._flush_status()
                     
                     try:
                         if convert_to == 'pdf':
@@ -453,36 +522,59 @@ class SimpleDownloadWorker(QObject):
                             )
                         
                         if conversion_result.success and conversion_result.output_path:
-                            self.status_update.emit(f"✅ Converted to {convert_to.upper()}: {conversion_result.output_path.name}")
+                            self._report(f"✅ Converted to {convert_to.upper()}: {conversion_result.output_path.name}")
                         else:
                             error_msg = conversion_result.error_message or "Unknown error"
-                            self.status_update.emit(f"❌ Conversion failed: {error_msg}")
+                            self._report(f"❌ Conversion failed: {error_msg}")
                     except Exception as e:
-                        self.status_update.emit(f"❌ Conversion error: {str(e)}")
+                        self._report(f"❌ Conversion error: {str(e)}")
                 
                 # Add to history
-                if result.gallery_info and result.download_path:
-                    try:
-                        history.add_download(
-                            gallery_info=result.gallery_info,
-                            download_path=str(result.download_path),
-                            files_count=result.files_downloaded,
-                            site="hentaifox"
-                        )
-                    except Exception as e:
-                        self.status_update.emit(f"⚠️ Could not add to history: {str(e)}")
+                self._add_to_history(result)
                 
-                self.download_complete.emit(self.url)
+                self._flush_status()
+                self.signals.download_complete.emit(self.url)
                 
             else:
                 error_msg = result.error_message or "Download failed"
-                self.status_update.emit(f"❌ Download failed: {error_msg}")
-                self.download_error.emit(error_msg)
+                self._report(f"❌ Download failed: {error_msg}")
+                self._flush_status()
+                self.signals.download_error.emit(error_msg)
                 
         except Exception as e:
-            self.status_update.emit(f"❌ Error: {str(e)}")
-            self.download_error.emit(str(e))
+            self._report(f"❌ Error: {str(e)}")
+            self._flush_status()
+            self.signals.download_error.emit(str(e))
             import traceback
             print(f"Download error: {traceback.format_exc()}")
         finally:
-            self.finished.emit()
\ No newline at end of file
+            self._flush_status()
+            self.signals.finished.emit()
+    
+    def _report(self, message: str):
+        """Queue a status message, sending queued messages at most every 0.1 s."""
+        self._pending_status.append(message)
+        if time.monotonic() - self._last_flush > 0.1:
+            self._flush_status()
+    
+    def _flush_status(self):
+        """Send queued status messages as one update."""
+        if self._pending_status:
+            self.signals.status_update.emit("\n".join(self._pending_status))
+            self._pending_status.clear()
+        self._last_flush = time.monotonic()
+    
+    def _add_to_history(self, result):
+        """Add a finished download to history."""
+        if not (result.gallery_info and result.download_path):
+            return
+        
+        try:
+            history.add_download(
+                gallery_info=result.gallery_info,
+                download_path=str(result.download_path),
+                files_count=result.files_downloaded,
+                site="hentaifox"
+            )
+        except Exception as e:
+            self._report(f"⚠️ Could not add to history: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""Color helpers shared by custom-painted widgets."""
+
+from PyQt6.QtGui import QColor
+
+
+def mix_colors(start: QColor, end: QColor, t: float) -> QColor:
+    """Linearly interpolate between two colors."""
+    return QColor.fromRgbF(
+        start.redF() + (end.redF() - start.redF()) * t,
+        start.greenF() + (end.greenF() - start.greenF()) * t,
+        start.blueF() + (end.blueF() - start.blueF()) * t,
+    )
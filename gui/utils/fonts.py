@@ -0,0 +1,14 @@
+"""Shared font cache for GUI widgets."""
+
+from functools import lru_cache
+
+from PyQt6.QtGui import QFont
+
+
+@lru_cache(maxsize=32)
+def get_font(family: str, size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Get a shared QFont, creating it on first use.
+    
+    setFont() copies the font, so callers must not modify the returned instance.
+    """
+    return QFont(family, size, weight)
@@ -0,0 +1,20 @@
+"""Helpers for working with Qt style sheets."""
+
+import re
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{};,])\s*")
+_GRADIENT_RE = re.compile(r"qlineargradient\([^)]*stop:[\d.]+\s*(#[0-9A-Fa-f]+)\s*\)")
+
+
+def minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace from a style sheet."""
+    qss = _COMMENT_RE.sub("", qss)
+    qss = _WHITESPACE_RE.sub(" ", qss)
+    return _PUNCTUATION_RE.sub(r"\1", qss).strip()
+
+
+def flatten_gradients(qss: str) -> str:
+    """Replace each linear gradient with the colour of its last stop."""
+    return _GRADIENT_RE.sub(r"\1", qss)
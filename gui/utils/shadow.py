@@ -0,0 +1,58 @@
+"""Pre-rendered drop shadows painted as nine-slice pixmaps."""
+
+from functools import lru_cache
+
+from PyQt6.QtCore import Qt, QRect, QRectF
+from PyQt6.QtGui import QImage, QPainter, QPixmap, QColor
+
+
+@lru_cache(maxsize=16)
+def shadow_pixmap(radius: int, blur: int, alpha: int) -> QPixmap:
+    """Render a blurred rounded-rect shadow once, sized for nine-slice drawing.
+
+    Corners are blur + radius pixels square with a single stretchable pixel between them.
+    """
+    side = 2 * (blur + radius) + 1
+    image = QImage(side, side, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, alpha))
+    painter.drawRoundedRect(QRectF(blur, blur, side - 2 * blur, side - 2 * blur), radius, radius)
+    painter.end()
+
+    # Approximate a gaussian by shrinking and smoothly scaling back up twice
+    small = max(1, side * 2 // max(blur, 1))
+    for _ in range(2):
+        image = image.scaled(small, small, Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+        image = image.scaled(side, side, Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+
+    return QPixmap.fromImage(image)
+
+
+def draw_shadow(painter: QPainter, rect: QRect, radius: int, blur: int, alpha: int = 40, offset: int = 0):
+    """Paint a cached shadow around rect, shifted down by offset."""
+    pixmap = shadow_pixmap(radius, blur, alpha)
+    corner = blur + radius
+    target = rect.adjusted(-blur, offset - blur, blur, offset + blur)
+    if target.width() < 2 * corner or target.height() < 2 * corner:
+        return
+
+    xs = (target.left(), target.left() + corner, target.right() + 1 - corner, target.right() + 1)
+    ys = (target.top(), target.top() + corner, target.bottom() + 1 - corner, target.bottom() + 1)
+    src = (0, corner, corner + 1, 2 * corner + 1)
+
+    for i in range(3):
+        for j in range(3):
+            # The middle is always covered by the widget itself
+            if i == 1 and j == 1:
+                continue
+            painter.drawPixmap(
+                QRect(xs[i], ys[j], xs[i + 1] - xs[i], ys[j + 1] - ys[j]),
+                pixmap,
+                QRect(src[i], src[j], src[i + 1] - src[i], src[j + 1] - src[j])
+            )
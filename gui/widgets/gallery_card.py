@@ -1,11 +1,66 @@
 """Gallery card widget for displaying gallery information."""
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QFrame, QGraphicsDropShadowEffect)
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QPixmap, QFont, QPainter, QPen, QBrush, QColor
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty, QRectF
+from PyQt6.QtGui import QFont, QPainter, QPen, QBrush, QColor, QLinearGradient
 # Removed theme manager - using simple styling
 from gui.widgets.modern_button import ModernButton
+from gui.utils.colors import mix_colors
+from gui.utils.shadow import draw_shadow
+from gui.utils.qss import minify_qss
+from gui.workers.thumbnail_worker import get_thumbnail_loader
+
+# Shadow geometry; the card keeps matching contents margins free for it
+_SHADOW_BLUR = 10
+_SHADOW_OFFSET = 4
+_SHADOW_ALPHA = 40
+_CARD_RADIUS = 16
+
+
+# Background gradient (top, bottom) and border colors, interpolated on hover
+_TOP_OFF, _TOP_ON = QColor("#1F2937"), QColor("#374151")
+_BOTTOM_OFF, _BOTTOM_ON = QColor("#111827"), QColor("#1F2937")
+_BORDER_OFF, _BORDER_ON = QColor("#4B5563"), QColor("#6B7280")
+
+
+# Detached tag labels kept for reuse across cards
+_TAG_POOL_SIZE = 64
+_tag_pool = []
+
+
+# Child label styles, applied once on the card instead of per label
+_CARD_QSS = minify_qss("""
+    QLabel#galleryThumb {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4B5563, stop:1 #374151);
+        border: 1px solid #6B7280;
+        border-radius: 12px;
+    }
+    
+    QLabel#galleryTitle {
+        color: #F8FAFC;
+        line-height: 1.4;
+    }
+    
+    QLabel#galleryArtist {
+        color: #8B5CF6;
+        font-weight: 500;
+    }
+    
+    QLabel#galleryPages {
+        color: #94A3B8;
+        font-weight: 400;
+    }
+    
+    QLabel#galleryTag {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8B5CF6, stop:1 #7C3AED);
+        color: #FFFFFF;
+        border-radius: 10px;
+        padding: 4px 8px;
+        font-weight: 500;
+    }
+""")
 
 
 class GalleryCard(QWidget):
@@ -28,6 +83,9 @@ class GalleryCard(QWidget):
         self.setup_ui()
         self.setup_styling()
         
+        # Thumbnails load in the background and arrive through this signal
+        get_thumbnail_loader().thumbnail_ready.connect(self.update_thumbnail)
+        
         if gallery_info:
             self.update_info(gallery_info)
     
@@ -51,15 +109,8 @@ class GalleryCard(QWidget):
         
         # Thumbnail placeholder
         self.thumbnail_label = QLabel()
+        self.thumbnail_label.setObjectName("galleryThumb")
         self.thumbnail_label.setFixedSize(90, 120)
-        self.thumbnail_label.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4B5563, stop:1 #374151);
-                border: 1px solid #6B7280;
-                border-radius: 12px;
-            }
-        """)
         self.thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.thumbnail_label.setText("📖")
         self.thumbnail_label.setFont(QFont("Segoe UI", 28))
@@ -72,20 +123,20 @@ class GalleryCard(QWidget):
         # Title
         self.title_label = QLabel("Gallery Title")
         self.title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        self.title_label.setStyleSheet("color: #F8FAFC; line-height: 1.4;")
+        self.title_label.setObjectName("galleryTitle")
         self.title_label.setWordWrap(True)
         info_layout.addWidget(self.title_label)
         
         # Artist
         self.artist_label = QLabel("Artist Name")
         self.artist_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Medium))
-        self.artist_label.setStyleSheet("color: #8B5CF6; font-weight: 500;")
+        self.artist_label.setObjectName("galleryArtist")
         info_layout.addWidget(self.artist_label)
         
         # Pages
         self.pages_label = QLabel("0 pages")
         self.pages_label.setFont(QFont("Segoe UI", 9))
-        self.pages_label.setStyleSheet("color: #94A3B8; font-weight: 400;")
+        self.pages_label.setObjectName("galleryPages")
         info_layout.addWidget(self.pages_label)
         
         # Tags container
@@ -118,98 +169,126 @@ class GalleryCard(QWidget):
     
     def setup_styling(self):
         """Setup card styling."""
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        self.setGraphicsEffect(shadow)
-        
-        self.update_styling()
+        # Background and shadow are painted directly in paintEvent
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, False)
+        # One sheet styles every child label by object name
+        self.setStyleSheet(_CARD_QSS)
+        self.setContentsMargins(
+            _SHADOW_BLUR, _SHADOW_BLUR - _SHADOW_OFFSET,
+            _SHADOW_BLUR, _SHADOW_BLUR + _SHADOW_OFFSET
+        )
     
     def update_styling(self):
         """Update styling based on hover state."""
-        # Beautiful gradient hover effect
-        if self._hover_progress > 0.5:
-            bg_gradient = """
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #374151, stop:1 #1F2937);
-                border: 1px solid #6B7280;
-            """
-        else:
-            bg_gradient = """
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1F2937, stop:1 #111827);
-                border: 1px solid #4B5563;
-            """
-        
-        self.setStyleSheet(f"""
-            GalleryCard {{
-                {bg_gradient}
-                border-radius: 16px;
-            }}
-        """)
+        self.update()
+    
+    def paintEvent(self, event):
+        """Paint the shadow and the hover-blended card background."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        card_rect = self.contentsRect()
+        draw_shadow(painter, card_rect, _CARD_RADIUS, _SHADOW_BLUR, _SHADOW_ALPHA, _SHADOW_OFFSET)
+        
+        t = self._hover_progress
+        gradient = QLinearGradient(0, card_rect.top(), 0, card_rect.bottom())
+        gradient.setColorAt(0, mix_colors(_TOP_OFF, _TOP_ON, t))
+        gradient.setColorAt(1, mix_colors(_BOTTOM_OFF, _BOTTOM_ON, t))
+        
+        painter.setPen(QPen(mix_colors(_BORDER_OFF, _BORDER_ON, t), 1))
+        painter.setBrush(QBrush(gradient))
+        painter.drawRoundedRect(QRectF(card_rect).adjusted(0.5, 0.5, -0.5, -0.5), _CARD_RADIUS, _CARD_RADIUS)
     
     def update_info(self, gallery_info):
         """Update card with gallery information."""
         self.gallery_info = gallery_info
         
         # Update labels
-        self.title_label.setText(gallery_info.get('title', 'Unknown Title'))
-        self.artist_label.setText(gallery_info.get('artist', 'Unknown Artist'))
-        self.pages_label.setText(f"{gallery_info.get('pages', 0)} pages")
+        self.title_label.setText(gallery_info.title or 'Unknown Title')
+        self.artist_label.setText(gallery_info.artist or 'Unknown Artist')
+        self.pages_label.setText(f"{gallery_info.pages or 0} pages")
+        self.update_thumbnail()
         
         # Update tags
         self.clear_tags()
-        tags = gallery_info.get('tags', [])[:3]  # Show max 3 tags
+        tags = (gallery_info.tags or [])[:3]  # Show max 3 tags
         for tag in tags:
             self.add_tag(tag)
     
+    def update_thumbnail(self, url: str = None):
+        """Show the gallery thumbnail once it has loaded."""
+        thumbnail_url = self.gallery_info.thumbnail if self.gallery_info else None
+        if not thumbnail_url or (url is not None and url != thumbnail_url):
+            return
+        
+        pixmap = get_thumbnail_loader().pixmap(thumbnail_url)
+        if pixmap is not None:
+            self.thumbnail_label.setText("")
+            self.thumbnail_label.setPixmap(pixmap)
+    
     def clear_tags(self):
-        """Clear all tag widgets."""
+        """Clear all tag widgets, keeping tag labels for reuse."""
         while self.tags_layout.count():
             child = self.tags_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = child.widget()
+            if widget is None:
+                continue
+            if widget.objectName() == "galleryTag" and len(_tag_pool) < _TAG_POOL_SIZE:
+                widget.setParent(None)
+                _tag_pool.append(widget)
+            else:
+                widget.deleteLater()
     
     def add_tag(self, tag_text: str):
         """Add a beautiful tag widget."""
-        tag_label = QLabel(tag_text)
-        tag_label.setFont(QFont("Segoe UI", 8, QFont.Weight.Medium))
-        tag_label.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8B5CF6, stop:1 #7C3AED);
-                color: #FFFFFF;
-                border-radius: 10px;
-                padding: 4px 8px;
-                font-weight: 500;
-            }
-        """)
+        if _tag_pool:
+            tag_label = _tag_pool.pop()
+            tag_label.setText(tag_text)
+        else:
+            tag_label = QLabel(tag_text)
+            tag_label.setFont(QFont("Segoe UI", 8, QFont.Weight.Medium))
+            tag_label.setObjectName("galleryTag")
         self.tags_layout.addWidget(tag_label)
     
     def enterEvent(self, event):
         """Handle mouse enter."""
         super().enterEvent(event)
+        # Offscreen cards skip the animation entirely
+        if self.visibleRegion().isEmpty():
+            return
         self.hover_animation.setEndValue(1.0)
         self.hover_animation.start()
     
     def leaveEvent(self, event):
         """Handle mouse leave."""
         super().leaveEvent(event)
+        if self.visibleRegion().isEmpty():
+            self.reset_hover()
+            return
         self.hover_animation.setEndValue(0.0)
         self.hover_animation.start()
     
+    def hideEvent(self, event):
+        """Stop hover work while the card is hidden."""
+        super().hideEvent(event)
+        self.reset_hover()
+    
+    def reset_hover(self):
+        """Stop the hover animation and drop back to the resting state."""
+        self.hover_animation.stop()
+        self._hover_progress = 0.0
+        self.update()
+    
     def on_download_clicked(self):
         """Handle download button click."""
-        if self.gallery_info and 'url' in self.gallery_info:
+        if self.gallery_info and self.gallery_info.url:
             self.download_button.set_loading(True)
-            self.download_requested.emit(self.gallery_info['url'])
+            self.download_requested.emit(self.gallery_info.url)
     
     def on_info_clicked(self):
         """Handle info button click."""
-        if self.gallery_info and 'url' in self.gallery_info:
-            self.info_requested.emit(self.gallery_info['url'])
+        if self.gallery_info and self.gallery_info.url:
+            self.info_requested.emit(self.gallery_info.url)
     
     def set_download_complete(self):
         """Set download complete state."""
@@ -0,0 +1,327 @@
+"""Model and delegate for painting gallery cards in a list view."""
+
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QEvent, QPoint, QRect, QRectF, QSize
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QLinearGradient, QFont, QFontMetrics, QPainterPath, QPixmap
+
+from gui.utils.fonts import get_font
+from gui.utils.shadow import draw_shadow
+from gui.workers.thumbnail_worker import get_thumbnail_loader
+
+# Card geometry, matching GalleryCard
+_CARD_WIDTH = 440
+_CARD_HEIGHT = 200
+_CARD_RADIUS = 16
+_PADDING = 16
+_SHADOW_BLUR = 10
+_SHADOW_OFFSET = 4
+_SHADOW_ALPHA = 40
+_THUMB_SIZE = QSize(90, 120)
+_BUTTON_HEIGHT = 32
+_INFO_BUTTON_WIDTH = 80
+_DOWNLOAD_BUTTON_WIDTH = 110
+_MAX_TAGS = 3
+_TAG_PILL_CACHE_SIZE = 64
+
+# Palette
+_CARD_TOP, _CARD_TOP_HOVER = QColor("#1F2937"), QColor("#374151")
+_CARD_BOTTOM, _CARD_BOTTOM_HOVER = QColor("#111827"), QColor("#1F2937")
+_CARD_BORDER, _CARD_BORDER_HOVER = QColor("#4B5563"), QColor("#6B7280")
+_THUMB_TOP, _THUMB_BOTTOM, _THUMB_BORDER = QColor("#4B5563"), QColor("#374151"), QColor("#6B7280")
+_TITLE_COLOR = QColor("#F8FAFC")
+_ARTIST_COLOR = QColor("#8B5CF6")
+_PAGES_COLOR = QColor("#94A3B8")
+_TAG_TOP, _TAG_BOTTOM = QColor("#8B5CF6"), QColor("#7C3AED")
+_WHITE = QColor("#FFFFFF")
+
+# Button (top, bottom) gradients, normal and hovered
+_BUTTON_COLORS = {
+    "default": ((QColor("#374151"), QColor("#1F2937")), (QColor("#4B5563"), QColor("#374151")), QColor("#4B5563")),
+    "primary": ((QColor("#8B5CF6"), QColor("#7C3AED")), (QColor("#A855F7"), QColor("#9333EA")), QColor("#A855F7")),
+}
+
+# Rendered tag pills keyed by (tag, device pixel ratio), oldest first
+_tag_pills = OrderedDict()
+
+
+def _tag_pill(tag: str, dpr: float) -> QPixmap:
+    """Get a rendered tag pill, reusing recently drawn ones."""
+    key = (tag, dpr)
+    pixmap = _tag_pills.get(key)
+    if pixmap is not None:
+        _tag_pills.move_to_end(key)
+        return pixmap
+
+    font = get_font("Segoe UI", 8, QFont.Weight.Medium)
+    metrics = QFontMetrics(font)
+    rect = QRect(QPoint(0, 0), QSize(metrics.horizontalAdvance(tag) + 16, metrics.height() + 8))
+
+    pixmap = QPixmap(rect.size() * dpr)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
+    gradient.setColorAt(0, _TAG_TOP)
+    gradient.setColorAt(1, _TAG_BOTTOM)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QBrush(gradient))
+    painter.drawRoundedRect(QRectF(rect), 10, 10)
+    painter.setFont(font)
+    painter.setPen(_WHITE)
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, tag)
+    painter.end()
+
+    _tag_pills[key] = pixmap
+    while len(_tag_pills) > _TAG_PILL_CACHE_SIZE:
+        _tag_pills.popitem(last=False)
+    return pixmap
+
+
+class GalleryListModel(QAbstractListModel):
+    """List model holding GallerySummary rows."""
+
+    GalleryRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._galleries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._galleries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        gallery = self._galleries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return gallery.title or 'Unknown Title'
+        if role == self.GalleryRole:
+            return gallery
+        return None
+
+    def set_galleries(self, galleries):
+        """Replace all galleries."""
+        self.beginResetModel()
+        self._galleries = list(galleries)
+        self.endResetModel()
+
+    def append_gallery(self, gallery):
+        """Append one gallery."""
+        row = len(self._galleries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._galleries.append(gallery)
+        self.endInsertRows()
+
+    def gallery(self, row: int):
+        """Get the GallerySummary for a row."""
+        return self._galleries[row]
+
+
+class GalleryCardDelegate(QStyledItemDelegate):
+    """Paints gallery cards and hit-tests their Info/Download buttons."""
+
+    download_requested = pyqtSignal(str)  # gallery_url
+    info_requested = pyqtSignal(str)      # gallery_url
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hovered_button = None  # (row, button name)
+
+        # Repaint once a requested thumbnail arrives
+        self._thumbnails = get_thumbnail_loader()
+        self._thumbnails.thumbnail_ready.connect(self._on_thumbnail_ready)
+        
+        # Drop the hover highlight when the pointer leaves or the view is hidden
+        if parent is not None:
+            parent.viewport().installEventFilter(self)
+
+    def _on_thumbnail_ready(self, url: str):
+        """Repaint the view after a thumbnail has loaded."""
+        view = self.parent()
+        if view is not None:
+            view.viewport().update()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Leave, QEvent.Type.Hide):
+            self.reset_hover()
+        return False
+    
+    def reset_hover(self):
+        """Clear the hovered button and repaint its row."""
+        if self._hovered_button is not None:
+            row = self._hovered_button[0]
+            self._hovered_button = None
+            self._update_row(row)
+    
+    def _update_row(self, row: int):
+        """Repaint one row; rows scrolled out of view cost nothing."""
+        view = self.parent()
+        if view is not None and view.model() is not None:
+            view.update(view.model().index(row, 0))
+    
+    def sizeHint(self, option, index):
+        return QSize(_CARD_WIDTH + 2 * _SHADOW_BLUR, _CARD_HEIGHT + 2 * _SHADOW_BLUR)
+
+    def _geometry(self, rect: QRect):
+        """Get the card, thumbnail, text and button rects for an item rect."""
+        card = QRect(
+            rect.x() + _SHADOW_BLUR, rect.y() + _SHADOW_BLUR - _SHADOW_OFFSET,
+            _CARD_WIDTH, _CARD_HEIGHT
+        )
+        inner = card.adjusted(_PADDING, _PADDING, -_PADDING, -_PADDING)
+        thumb = QRect(inner.topLeft(), _THUMB_SIZE)
+        text = QRect(thumb.right() + 13, inner.top(), inner.right() - thumb.right() - 12, _THUMB_SIZE.height())
+        button_top = inner.bottom() + 1 - _BUTTON_HEIGHT
+        info = QRect(inner.left(), button_top, _INFO_BUTTON_WIDTH, _BUTTON_HEIGHT)
+        download = QRect(inner.right() + 1 - _DOWNLOAD_BUTTON_WIDTH, button_top, _DOWNLOAD_BUTTON_WIDTH, _BUTTON_HEIGHT)
+        return card, thumb, text, info, download
+
+    def paint(self, painter, option, index):
+        gallery = index.data(GalleryListModel.GalleryRole)
+        if gallery is None:
+            return
+
+        card, thumb, text, info, download = self._geometry(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Shadow and background
+        draw_shadow(painter, card, _CARD_RADIUS, _SHADOW_BLUR, _SHADOW_ALPHA, _SHADOW_OFFSET)
+        gradient = QLinearGradient(0, card.top(), 0, card.bottom())
+        gradient.setColorAt(0, _CARD_TOP_HOVER if hovered else _CARD_TOP)
+        gradient.setColorAt(1, _CARD_BOTTOM_HOVER if hovered else _CARD_BOTTOM)
+        painter.setPen(QPen(_CARD_BORDER_HOVER if hovered else _CARD_BORDER, 1))
+        painter.setBrush(QBrush(gradient))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), _CARD_RADIUS, _CARD_RADIUS)
+
+        self._paint_thumbnail(painter, thumb, gallery.thumbnail)
+        self._paint_text(painter, text, gallery)
+
+        row = index.row()
+        self._paint_button(painter, info, "Info", "default", self._hovered_button == (row, "info"))
+        self._paint_button(painter, download, "Download", "primary", self._hovered_button == (row, "download"))
+
+        painter.restore()
+
+    def _paint_thumbnail(self, painter, rect: QRect, url):
+        """Paint the thumbnail, or a placeholder until it has loaded."""
+        pixmap = self._thumbnails.pixmap(url) if url else None
+        if pixmap is not None:
+            clip = QPainterPath()
+            clip.addRoundedRect(QRectF(rect), 12, 12)
+            painter.save()
+            painter.setClipPath(clip)
+            painter.drawPixmap(rect, pixmap)
+            painter.restore()
+            return
+
+        gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
+        gradient.setColorAt(0, _THUMB_TOP)
+        gradient.setColorAt(1, _THUMB_BOTTOM)
+        painter.setPen(QPen(_THUMB_BORDER, 1))
+        painter.setBrush(QBrush(gradient))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+
+        painter.setFont(get_font("Segoe UI", 28))
+        painter.setPen(_WHITE)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "📖")
+
+    def _paint_text(self, painter, rect: QRect, gallery):
+        """Paint title, artist, pages and tags."""
+        y = rect.top()
+
+        # Title, wrapped to at most two lines
+        title_font = get_font("Segoe UI", 12, QFont.Weight.Bold)
+        metrics = QFontMetrics(title_font)
+        title_rect = QRect(rect.left(), y, rect.width(), metrics.lineSpacing() * 2)
+        painter.setFont(title_font)
+        painter.setPen(_TITLE_COLOR)
+        painter.drawText(
+            title_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            gallery.title or 'Unknown Title'
+        )
+        y = title_rect.bottom() + 7
+
+        # Artist and pages
+        for text, font, color in (
+            (gallery.artist or 'Unknown Artist', get_font("Segoe UI", 10, QFont.Weight.Medium), _ARTIST_COLOR),
+            (f"{gallery.pages or 0} pages", get_font("Segoe UI", 9), _PAGES_COLOR),
+        ):
+            metrics = QFontMetrics(font)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(
+                QRect(rect.left(), y, rect.width(), metrics.height()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                metrics.elidedText(text, Qt.TextElideMode.ElideRight, rect.width())
+            )
+            y += metrics.height() + 6
+
+        # Tag pills, rendered once and reused across rows and repaints
+        dpr = painter.device().devicePixelRatioF()
+        x = rect.left()
+        for tag in (gallery.tags or [])[:_MAX_TAGS]:
+            pill = _tag_pill(tag, dpr)
+            width = pill.deviceIndependentSize().toSize().width()
+            if x + width - 1 > rect.right():
+                break
+            painter.drawPixmap(x, y, pill)
+            x += width + 4
+
+    def _paint_button(self, painter, rect: QRect, text: str, button_type: str, hovered: bool):
+        """Paint a ModernButton-styled button."""
+        normal, hover, border = _BUTTON_COLORS[button_type]
+        top, bottom = hover if hovered else normal
+        gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
+        gradient.setColorAt(0, top)
+        gradient.setColorAt(1, bottom)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(QBrush(gradient))
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+
+        painter.setFont(get_font("Segoe UI", 10, QFont.Weight.Medium))
+        painter.setPen(_WHITE)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+    def _button_at(self, option, pos):
+        """Get the name of the button under pos, if any."""
+        _, _, _, info, download = self._geometry(option.rect)
+        if info.contains(pos):
+            return "info"
+        if download.contains(pos):
+            return "download"
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+
+        if event_type == QEvent.Type.MouseMove:
+            button = self._button_at(option, event.position().toPoint())
+            hovered = (index.row(), button) if button else None
+            if hovered != self._hovered_button:
+                previous, self._hovered_button = self._hovered_button, hovered
+                if previous is not None:
+                    self._update_row(previous[0])
+                if hovered is not None and (previous is None or previous[0] != hovered[0]):
+                    self._update_row(hovered[0])
+            return False
+
+        if event_type == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            button = self._button_at(option, event.position().toPoint())
+            url = index.data(GalleryListModel.GalleryRole).url
+            if button and url:
+                if button == "info":
+                    self.info_requested.emit(url)
+                else:
+                    self.download_requested.emit(url)
+                return True
+
+        return super().editorEvent(event, model, option, index)
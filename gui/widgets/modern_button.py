@@ -1,16 +1,49 @@
 """Modern animated button widget with beautiful styling."""
 
-from PyQt6.QtWidgets import QPushButton, QGraphicsDropShadowEffect
-from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, pyqtProperty, QRect, QRectF, Qt
-from PyQt6.QtGui import QColor, QPainter, QPen, QBrush, QFont, QLinearGradient, QPainterPath
+from PyQt6.QtWidgets import QPushButton
+from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, pyqtSignal, QTimer, pyqtProperty, QRect, QRectF, QPointF, QSize, QEvent, Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QBrush, QFont, QLinearGradient, QPixmap, QStaticText, QTransform
 import math
 
+from gui.utils.colors import mix_colors
+from gui.utils.fonts import get_font
+from gui.utils.shadow import draw_shadow
+
+# Shadow geometry; the button keeps this much room around its body for it
+_SHADOW_BLUR = 8
+_SHADOW_OFFSET = 3
+_SHADOW_ALPHA = 60
+
 
 class ModernButton(QPushButton):
     """Ultra-modern button with gradient backgrounds, smooth animations, and ripple effects."""
     
     clicked_animated = pyqtSignal()
     
+    # Gradient (top, bottom) colors at rest and on hover/press, plus border, per button type
+    _PALETTE = {
+        "primary": {
+            "base": (QColor('#8B5CF6'), QColor('#7C3AED')),   # Purple 500 / 600
+            "hover": (QColor('#A855F7'), QColor('#9333EA')),
+            "border": QColor('#A855F7'),
+        },
+        "danger": {
+            "base": (QColor('#EF4444'), QColor('#DC2626')),   # Red 500 / 600
+            "hover": (QColor('#F87171'), QColor('#EF4444')),
+            "border": QColor('#F87171'),
+        },
+        "secondary": {
+            "base": (QColor('#6B7280'), QColor('#4B5563')),   # Gray 500 / 600
+            "hover": (QColor('#9CA3AF'), QColor('#6B7280')),
+            "border": QColor('#9CA3AF'),
+        },
+        "default": {
+            "base": (QColor('#374151'), QColor('#1F2937')),   # Gray 700 / 800
+            "hover": (QColor('#4B5563'), QColor('#374151')),
+            "border": QColor('#4B5563'),
+        },
+    }
+    
     def __init__(self, text="", parent=None, button_type="default"):
         super().__init__(text, parent)
         self.button_type = button_type
@@ -21,6 +54,27 @@ class ModernButton(QPushButton):
         self._ripple_progress = 0.0
         self._ripple_x = 0
         self._ripple_y = 0
+        self._ripple_max_radius = 0.0
+        self._ripple_color = QColor(255, 255, 255, 0)
+        self._ripple_brush = QBrush(self._ripple_color)
+        self._dirty_rect = QRect()
+        
+        # One reusable zero-delay timer flushes all pending repaints together
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_update)
+        
+        # Paint caches; gradients depend on height and are rebuilt on resize
+        self._gradient_cache = {}
+        self._bg_pixmaps = {}
+        self._static_text = QStaticText(text)
+        self._static_text.setTextFormat(Qt.TextFormat.PlainText)
+        
+        # Reusable paint objects
+        self._pen = QPen(QColor(), 1)
+        self._text_color_enabled = QColor('#FFFFFF')
+        self._text_color_disabled = QColor('#9CA3AF')
         
         # Setup animations
         self.hover_animation = QPropertyAnimation(self, b"hover_progress")
@@ -48,20 +102,14 @@ class ModernButton(QPushButton):
         # Remove default button styling
         self.setFlat(True)
         
-        # Set minimum size and padding
-        self.setMinimumHeight(40)
-        self.setMinimumWidth(100)
+        # Not WA_OpaquePaintEvent: the rounded corners and shadow margins are transparent
         
-        # Add beautiful shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        self.setGraphicsEffect(shadow)
+        # Set minimum size and padding, plus room for the shadow
+        self.setMinimumHeight(40 + 2 * _SHADOW_BLUR)
+        self.setMinimumWidth(100 + 2 * _SHADOW_BLUR)
         
         # Set modern font
-        font = QFont("Segoe UI", 10, QFont.Weight.Medium)
-        self.setFont(font)
+        self.setFont(get_font("Segoe UI", 10, QFont.Weight.Medium))
         
         # Apply base styling
         self.setStyleSheet(self.get_base_style())
@@ -72,8 +120,10 @@ class ModernButton(QPushButton):
     
     @hover_progress.setter
     def hover_progress(self, value):
+        level = self._state_level()
         self._hover_progress = value
-        self.update()
+        if self._state_level() != level:
+            self._schedule_update()
     
     @pyqtProperty(float)
     def press_progress(self):
@@ -81,8 +131,10 @@ class ModernButton(QPushButton):
     
     @press_progress.setter
     def press_progress(self, value):
+        level = self._state_level()
         self._press_progress = value
-        self.update()
+        if self._state_level() != level:
+            self._schedule_update()
     
     @pyqtProperty(float)
     def ripple_progress(self):
@@ -91,7 +143,65 @@ class ModernButton(QPushButton):
     @ripple_progress.setter
     def ripple_progress(self, value):
         self._ripple_progress = value
-        self.update()
+        # Only the ripple's bounding box changes between frames
+        self._schedule_update(self._ripple_rect())
+    
+    def _ripple_rect(self):
+        """Get the bounding box of the ripple at its current size."""
+        radius = int(self._ripple_max_radius * self._ripple_progress) + 2
+        return QRect(self._ripple_x - radius, self._ripple_y - radius, 2 * radius, 2 * radius)
+    
+    def _state_level(self):
+        """Get the hover/press level, quantized to the 8 cached background variants."""
+        return max(int(self._hover_progress * 7.99), int(self._press_progress * 7.99))
+    
+    def _schedule_update(self, rect: QRect = None):
+        """Repaint once per event loop turn however many properties changed."""
+        self._dirty_rect = self._dirty_rect.united(self.rect() if rect is None else rect)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def _flush_update(self):
+        """Run the scheduled repaint."""
+        rect, self._dirty_rect = self._dirty_rect, QRect()
+        self.update(rect)
+    
+    def setText(self, text):
+        """Set the text and lay it out again."""
+        super().setText(text)
+        self._static_text.setText(text)
+        self._static_text.prepare(QTransform(), self.font())
+    
+    def changeEvent(self, event):
+        """Lay the text out again when the font changes."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._static_text.prepare(QTransform(), self.font())
+            self._bg_pixmaps.clear()
+    
+    def body_rect(self):
+        """Get the button body's rect, inside the shadow margins."""
+        return self.rect().adjusted(
+            _SHADOW_BLUR, _SHADOW_BLUR - _SHADOW_OFFSET,
+            -_SHADOW_BLUR, -_SHADOW_BLUR - _SHADOW_OFFSET
+        )
+    
+    def sizeHint(self):
+        """Size hint with room for the shadow."""
+        hint = super().sizeHint()
+        return QSize(hint.width() + 2 * _SHADOW_BLUR, hint.height() + 2 * _SHADOW_BLUR)
+    
+    def hitButton(self, pos):
+        """Only the body reacts to clicks, not the shadow."""
+        return self.body_rect().contains(pos)
+    
+    def resizeEvent(self, event):
+        """Drop size-dependent paint caches."""
+        super().resizeEvent(event)
+        body = self.body_rect()
+        self._ripple_max_radius = math.hypot(body.width(), body.height()) * 0.5
+        self._gradient_cache.clear()
+        self._bg_pixmaps.clear()
     
     def enterEvent(self, event):
         """Handle mouse enter event."""
@@ -118,145 +228,150 @@ class ModernButton(QPushButton):
     def on_clicked(self):
         """Handle button click with ripple effect."""
         # Start ripple from center
-        self._ripple_x = self.width() // 2
-        self._ripple_y = self.height() // 2
+        center = self.body_rect().center()
+        self._ripple_x = center.x()
+        self._ripple_y = center.y()
         
         self.ripple_animation.setStartValue(0.0)
         self.ripple_animation.setEndValue(1.0)
         self.ripple_animation.start()
         
-        # Emit custom signal after animation
-        QTimer.singleShot(100, self.clicked_animated.emit)
+        # Emit custom signal right away
+        self.clicked_animated.emit()
     
     def paintEvent(self, event):
         """Custom paint event with beautiful gradients and animations."""
+        # Get button rect and skip work outside the dirty region
+        rect = self.rect()
+        region = event.region()
+        if not region.intersects(rect):
+            return
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Get button rect
-        rect = self.rect()
+        # Background, border and text come from a cached pixmap
+        painter.drawPixmap(0, 0, self.get_background_pixmap(rect))
         
-        # Create rounded rectangle path
-        path = QPainterPath()
-        radius = 12
-        # Convert QRect to QRectF for addRoundedRect
-        rectf = QRectF(rect)
-        path.addRoundedRect(rectf, radius, radius)
+        # Draw ripple effect, kept off the shadow
+        if self._ripple_progress > 0 and region.intersects(self._ripple_rect()):
+            body = self.body_rect()
+            painter.setClipRect(body)
+            painter.setPen(Qt.PenStyle.NoPen)
+            self.draw_ripple_effect(painter, body)
+    
+    def get_background_pixmap(self, rect):
+        """Get the static shadow, background, border and text rendered to a pixmap."""
+        # Quantized hover/press level so animation frames reuse pixmaps
+        level = self._state_level()
+        dpr = self.devicePixelRatioF()
+        key = (rect.width(), rect.height(), dpr, self.button_type, level, self.isEnabled(), self.text())
+        pixmap = self._bg_pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+        
+        pixmap = QPixmap(round(rect.width() * dpr), round(rect.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Shadow from the shared pre-blurred pixmap, then paint the body in its own coordinates
+        body = self.body_rect()
+        draw_shadow(painter, body, 12, _SHADOW_BLUR, _SHADOW_ALPHA, _SHADOW_OFFSET)
+        painter.translate(body.topLeft())
+        rect = QRect(0, 0, body.width(), body.height())
         
         # Create gradient based on button type and state
         gradient = self.create_gradient(rect)
         
         # Apply hover and press effects
-        if self._hover_progress > 0 or self._press_progress > 0:
-            # Modify gradient for hover/press
-            gradient = self.modify_gradient_for_state(gradient)
+        if level:
+            # Blend towards the hover gradient
+            gradient = self.modify_gradient_for_state(gradient, level / 7)
         
-        # Draw button background
-        painter.fillPath(path, QBrush(gradient))
-        
-        # Draw border
-        border_color = self.get_border_color()
-        painter.setPen(QPen(border_color, 1))
-        painter.drawPath(path)
-        
-        # Draw ripple effect
-        if self._ripple_progress > 0:
-            self.draw_ripple_effect(painter, rect)
+        # Draw button background and border in one rounded rect
+        painter.setBrush(QBrush(gradient))
+        self._pen.setColor(self.get_border_color())
+        painter.setPen(self._pen)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
         
         # Draw text
         self.draw_text(painter, rect)
+        painter.end()
+        
+        # Evict the oldest entry once the cache is full
+        if len(self._bg_pixmaps) >= 16:
+            del self._bg_pixmaps[next(iter(self._bg_pixmaps))]
+        self._bg_pixmaps[key] = pixmap
+        return pixmap
     
     def create_gradient(self, rect):
         """Create gradient based on button type."""
-        gradient = QLinearGradient(0, 0, 0, rect.height())
+        key = (self.button_type, "base", rect.height())
+        gradient = self._gradient_cache.get(key)
+        if gradient is not None:
+            return gradient
         
-        if self.button_type == "primary":
-            # Beautiful purple gradient
-            gradient.setColorAt(0, QColor('#8B5CF6'))  # Purple 500
-            gradient.setColorAt(1, QColor('#7C3AED'))  # Purple 600
-        elif self.button_type == "danger":
-            # Beautiful red gradient
-            gradient.setColorAt(0, QColor('#EF4444'))  # Red 500
-            gradient.setColorAt(1, QColor('#DC2626'))  # Red 600
-        elif self.button_type == "secondary":
-            # Beautiful gray gradient
-            gradient.setColorAt(0, QColor('#6B7280'))  # Gray 500
-            gradient.setColorAt(1, QColor('#4B5563'))  # Gray 600
-        else:
-            # Default dark gradient
-            gradient.setColorAt(0, QColor('#374151'))  # Gray 700
-            gradient.setColorAt(1, QColor('#1F2937'))  # Gray 800
+        top, bottom = self.get_palette()["base"]
+        gradient = QLinearGradient(0, 0, 0, rect.height())
+        gradient.setColorAt(0, top)
+        gradient.setColorAt(1, bottom)
         
+        self._gradient_cache[key] = gradient
         return gradient
     
-    def modify_gradient_for_state(self, gradient):
-        """Modify gradient for hover/press states."""
+    def modify_gradient_for_state(self, gradient, amount: float = 1.0):
+        """Modify gradient for hover/press states, blended by amount."""
+        key = (self.button_type, "hover", amount, gradient.finalStop().y())
+        new_gradient = self._gradient_cache.get(key)
+        if new_gradient is not None:
+            return new_gradient
+        
         # Create a brighter version for hover/press
+        palette = self.get_palette()
         new_gradient = QLinearGradient(gradient)
+        new_gradient.setColorAt(0, mix_colors(palette["base"][0], palette["hover"][0], amount))
+        new_gradient.setColorAt(1, mix_colors(palette["base"][1], palette["hover"][1], amount))
         
-        # Make colors brighter
-        colors = []
-        positions = []
-        
-        # Extract colors and positions (simplified approach)
-        if self.button_type == "primary":
-            new_gradient.setColorAt(0, QColor('#A855F7'))  # Brighter purple
-            new_gradient.setColorAt(1, QColor('#9333EA'))
-        elif self.button_type == "danger":
-            new_gradient.setColorAt(0, QColor('#F87171'))  # Brighter red
-            new_gradient.setColorAt(1, QColor('#EF4444'))
-        elif self.button_type == "secondary":
-            new_gradient.setColorAt(0, QColor('#9CA3AF'))  # Brighter gray
-            new_gradient.setColorAt(1, QColor('#6B7280'))
-        else:
-            new_gradient.setColorAt(0, QColor('#4B5563'))  # Brighter default
-            new_gradient.setColorAt(1, QColor('#374151'))
-        
+        self._gradient_cache[key] = new_gradient
         return new_gradient
     
+    def get_palette(self):
+        """Get the palette entry for the button type."""
+        return self._PALETTE.get(self.button_type, self._PALETTE["default"])
+    
     def get_border_color(self):
         """Get border color based on button type."""
-        if self.button_type == "primary":
-            return QColor('#A855F7')
-        elif self.button_type == "danger":
-            return QColor('#F87171')
-        elif self.button_type == "secondary":
-            return QColor('#9CA3AF')
-        else:
-            return QColor('#4B5563')
+        return self.get_palette()["border"]
     
     def draw_ripple_effect(self, painter, rect):
         """Draw beautiful ripple effect."""
-        # Calculate ripple radius
-        max_radius = math.sqrt(rect.width()**2 + rect.height()**2) / 2
-        radius = max_radius * self._ripple_progress
+        # Ripple radius grows towards the cached half-diagonal
+        radius = self._ripple_max_radius * self._ripple_progress
         
-        # Create ripple color
-        ripple_color = QColor(255, 255, 255, int(40 * (1 - self._ripple_progress)))
+        # Fade the shared ripple color out as it grows
+        self._ripple_color.setAlpha(int(40 * (1 - self._ripple_progress)))
+        self._ripple_brush.setColor(self._ripple_color)
         
         # Draw ripple
-        painter.setBrush(QBrush(ripple_color))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(
-            int(self._ripple_x - radius),
-            int(self._ripple_y - radius),
-            int(radius * 2),
-            int(radius * 2)
-        )
+        painter.setBrush(self._ripple_brush)
+        painter.drawEllipse(QPointF(self._ripple_x, self._ripple_y), radius, radius)
     
     def draw_text(self, painter, rect):
         """Draw button text with proper styling."""
         # Set text color
-        if self.isEnabled():
-            text_color = QColor('#FFFFFF')
-        else:
-            text_color = QColor('#9CA3AF')
-        
-        painter.setPen(text_color)
+        self._pen.setColor(self._text_color_enabled if self.isEnabled() else self._text_color_disabled)
+        painter.setPen(self._pen)
         painter.setFont(self.font())
         
-        # Draw text centered
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text())
+        # Draw the pre-laid-out text centered
+        size = self._static_text.size()
+        painter.drawStaticText(
+            QPointF(rect.x() + (rect.width() - size.width()) / 2, rect.y() + (rect.height() - size.height()) / 2),
+            self._static_text
+        )
     
     def get_base_style(self):
         """Get base stylesheet."""
@@ -1,10 +1,29 @@
 """Modern progress widget with animations."""
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
-from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QTimer, pyqtSignal, pyqtProperty
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QGraphicsOpacityEffect
+from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, pyqtSignal, pyqtProperty
 from PyQt6.QtGui import QFont, QPainter, QPen, QBrush, QColor
+from gui.utils.fonts import get_font
+from gui.utils.qss import minify_qss
 # Removed theme manager - using simple styling
 
+# Progress bar style with the chunk fill left as a placeholder
+_BAR_QSS = """
+    QProgressBar {
+        border: none;
+        border-radius: 8px;
+        background-color: #3d3d3d;
+        text-align: center;
+        font-weight: 500;
+        height: 16px;
+        color: #ffffff;
+    }
+    QProgressBar::chunk {
+        border-radius: 8px;
+        %s
+    }
+"""
+
 
 class ModernProgressBar(QProgressBar):
     """Custom progress bar with smooth animations."""
@@ -19,23 +38,7 @@ class ModernProgressBar(QProgressBar):
         self.value_animation.setDuration(300)
         self.value_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         
-        self.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 8px;
-                background-color: #3d3d3d;
-                text-align: center;
-                font-weight: 500;
-                height: 16px;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                border-radius: 8px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #bb86fc,
-                    stop:1 #03dac6);
-            }
-        """)
+        self.setStyleSheet(ProgressWidget._QSS_DEFAULT)
     
     @pyqtProperty(float)
     def animated_value(self):
@@ -48,6 +51,15 @@ class ModernProgressBar(QProgressBar):
     
     def setValue(self, value):
         """Set value with smooth animation."""
+        # Hidden bars and tiny steps jump straight to the new value
+        if not self.isVisible() or abs(value - self._animated_value) < 1:
+            self.value_animation.stop()
+            self._animated_value = value
+            super().setValue(int(value))
+            return
+        
+        if self.value_animation.state() == QPropertyAnimation.State.Running:
+            self.value_animation.stop()
         self.value_animation.setStartValue(self._animated_value)
         self.value_animation.setEndValue(value)
         self.value_animation.start()
@@ -58,15 +70,20 @@ class ProgressWidget(QWidget):
     
     cancelled = pyqtSignal()
     
+    # Progress bar style variants, swapped only when the state changes
+    _QSS_DEFAULT = minify_qss(_BAR_QSS % """
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #bb86fc,
+            stop:1 #03dac6);
+    """)
+    _QSS_SUCCESS = minify_qss(_BAR_QSS % "background-color: #4caf50;")
+    _QSS_ERROR = minify_qss(_BAR_QSS % "background-color: #cf6679;")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # Using simple black theme
+        self._state = "default"
         self.setup_ui()
-        
-        # Animation timer for pulse effect (will be created when needed)
-        self.pulse_timer = None
-        self.pulse_opacity = 1.0
-        self.pulse_direction = -1
     
     def setup_ui(self):
         """Setup the progress widget UI."""
@@ -76,7 +93,7 @@ class ProgressWidget(QWidget):
         
         # Title label
         self.title_label = QLabel("Processing...")
-        self.title_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
+        self.title_label.setFont(get_font("Segoe UI", 11, QFont.Weight.Medium))
         self.title_label.setStyleSheet("color: #ffffff;")
         layout.addWidget(self.title_label)
         
@@ -86,12 +103,25 @@ class ProgressWidget(QWidget):
         self.progress_bar.setMaximum(100)
         layout.addWidget(self.progress_bar)
         
+        # Pulse effect for indeterminate progress, driven by Qt's animation framework
+        self._opacity_effect = QGraphicsOpacityEffect(self.progress_bar)
+        self._opacity_effect.setOpacity(1.0)
+        self.progress_bar.setGraphicsEffect(self._opacity_effect)
+        
+        self._pulse_anim = QPropertyAnimation(self._opacity_effect, b"opacity")
+        self._pulse_anim.setDuration(800)
+        self._pulse_anim.setKeyValueAt(0.0, 1.0)
+        self._pulse_anim.setKeyValueAt(0.5, 0.6)
+        self._pulse_anim.setKeyValueAt(1.0, 1.0)
+        self._pulse_anim.setLoopCount(-1)
+        self._pulse_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
+        
         # Status layout
         status_layout = QHBoxLayout()
         
         # Status label
         self.status_label = QLabel("Initializing...")
-        self.status_label.setFont(QFont("Segoe UI", 9))
+        self.status_label.setFont(get_font("Segoe UI", 9))
         self.status_label.setStyleSheet("color: #b3b3b3;")
         status_layout.addWidget(self.status_label)
         
@@ -99,7 +129,7 @@ class ProgressWidget(QWidget):
         
         # Speed label
         self.speed_label = QLabel("")
-        self.speed_label.setFont(QFont("Segoe UI", 9))
+        self.speed_label.setFont(get_font("Segoe UI", 9))
         self.speed_label.setStyleSheet("color: #b3b3b3;")
         status_layout.addWidget(self.speed_label)
         
@@ -110,7 +140,7 @@ class ProgressWidget(QWidget):
         
         # Files count
         self.files_label = QLabel("")
-        self.files_label.setFont(QFont("Segoe UI", 8))
+        self.files_label.setFont(get_font("Segoe UI", 8))
         self.files_label.setStyleSheet("color: #666666;")
         details_layout.addWidget(self.files_label)
         
@@ -118,7 +148,7 @@ class ProgressWidget(QWidget):
         
         # Time remaining
         self.time_label = QLabel("")
-        self.time_label.setFont(QFont("Segoe UI", 8))
+        self.time_label.setFont(get_font("Segoe UI", 8))
         self.time_label.setStyleSheet("color: #666666;")
         details_layout.addWidget(self.time_label)
         
@@ -171,69 +201,49 @@ class ProgressWidget(QWidget):
     
     def start_pulse(self):
         """Start pulse animation for indeterminate progress."""
-        if self.pulse_timer is None:
-            self.pulse_timer = QTimer()
-            self.pulse_timer.timeout.connect(self.pulse_animation)
-        self.pulse_timer.start(50)
+        # Only pulse while indeterminate and on screen; showEvent resumes it
+        if self.progress_bar.maximum() == 0 and self.isVisible():
+            self._pulse_anim.start()
     
     def stop_pulse(self):
         """Stop pulse animation."""
-        if self.pulse_timer is not None:
-            self.pulse_timer.stop()
-        self.opacity = 1.0
+        self._pulse_anim.stop()
+        self._opacity_effect.setOpacity(1.0)
     
-    def pulse_animation(self):
-        """Animate pulse effect."""
-        self.pulse_opacity += self.pulse_direction * 0.02
-        
-        if self.pulse_opacity <= 0.6:
-            self.pulse_direction = 1
-        elif self.pulse_opacity >= 1.0:
-            self.pulse_direction = -1
-        
-        self.opacity = self.pulse_opacity
+    def showEvent(self, event):
+        """Resume the pulse when shown in indeterminate mode."""
+        super().showEvent(event)
+        self.start_pulse()
+    
+    def hideEvent(self, event):
+        """Pause the pulse while hidden."""
+        super().hideEvent(event)
+        self._pulse_anim.stop()
     
     def set_complete(self):
         """Set progress to complete state."""
+        self.stop_pulse()
         self.set_progress(100)
         self.set_status("Complete!")
-        self.stop_pulse()
         
         # Flash success color
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 8px;
-                background-color: #3d3d3d;
-                text-align: center;
-                font-weight: 500;
-                height: 16px;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                border-radius: 8px;
-                background-color: #4caf50;
-            }
-        """)
+        self._apply_state("success", self._QSS_SUCCESS)
     
     def set_error(self, error_message: str):
         """Set progress to error state."""
-        self.set_status(f"Error: {error_message}")
         self.stop_pulse()
+        self.set_status(f"Error: {error_message}")
         
         # Flash error color
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 8px;
-                background-color: #3d3d3d;
-                text-align: center;
-                font-weight: 500;
-                height: 16px;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                border-radius: 8px;
-                background-color: #cf6679;
-            }
-        """)
\ No newline at end of file
+        self._apply_state("error", self._QSS_ERROR)
+    
+    def reset_progress_style(self):
+        """Restore the default progress bar colors."""
+        self._apply_state("default", self._QSS_DEFAULT)
+    
+    def _apply_state(self, name: str, qss: str):
+        """Apply a progress bar style variant unless it is already applied."""
+        if self._state == name:
+            return
+        self.progress_bar.setStyleSheet(qss)
+        self._state = name
\ No newline at end of file
@@ -1,42 +1,240 @@
 """Main application window."""
 
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+import importlib
+import os
+
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QTabWidget, QStatusBar, QMenuBar, QToolBar, QSplitter)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QIcon, QFont
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QAction, QIcon, QFont, QKeySequence
 
 # Removed theme manager - using simple styling
 # Temporarily comment out AnimationManager to debug
 # from gui.utils.animations import AnimationManager
-# Import tabs one by one to test
-try:
-    from gui.tabs.simple_download_tab import SimpleDownloadTab as DownloadTab
-    DOWNLOAD_TAB_AVAILABLE = True
-except ImportError as e:
-    print(f"Download tab import error: {e}")
-    DOWNLOAD_TAB_AVAILABLE = False
 
-try:
-    from gui.tabs.search_tab import SearchTab
-    SEARCH_TAB_AVAILABLE = True
-except ImportError as e:
-    print(f"Search tab import error: {e}")
-    SEARCH_TAB_AVAILABLE = False
+from gui.widgets.modern_button import ModernButton
+from gui.utils.qss import minify_qss, flatten_gradients
 
-try:
-    from gui.tabs.history_tab import HistoryTab
-    HISTORY_TAB_AVAILABLE = True
-except ImportError as e:
-    print(f"History tab import error: {e}")
-    HISTORY_TAB_AVAILABLE = False
 
-try:
-    from gui.tabs.settings_tab import SettingsTab
-    SETTINGS_TAB_AVAILABLE = True
-except ImportError as e:
-    print(f"Settings tab import error: {e}")
-    SETTINGS_TAB_AVAILABLE = False
-from gui.widgets.modern_button import ModernButton
+# Tabs by index: (attribute, module, class, label); each module is imported when its tab is built
+_TAB_REGISTRY = {
+    0: ("download_tab", "gui.tabs.simple_download_tab", "SimpleDownloadTab", "📥 Download"),
+    1: ("search_tab", "gui.tabs.search_tab", "SearchTab", "🔍 Search"),
+    2: ("history_tab", "gui.tabs.history_tab", "HistoryTab", "📚 History"),
+    3: ("settings_tab", "gui.tabs.settings_tab", "SettingsTab", "⚙️ Settings"),
+}
+
+
+# Menu shortcuts, built once instead of parsed from text per action
+_SHORTCUTS = {
+    'new_download': QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_N),
+    # Windows has no standard Quit binding, so Ctrl+Q is spelled out
+    'exit': QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_Q),
+    'search': QKeySequence(QKeySequence.StandardKey.Find),
+    'history': QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_H),
+    'settings': QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_Comma),
+}
+
+# Signal connections between tabs: (source tab, signal, target tab, slot)
+WIRINGS = (
+    ('search_tab', 'download_requested', 'download_tab', 'add_download'),
+    ('download_tab', 'download_completed', 'history_tab', 'refresh_history'),
+    ('settings_tab', 'settings_changed', 'download_tab', 'refresh_settings'),
+)
+
+
+# Window chrome, set on the main window; QWidget applies everywhere
+_MAIN_QSS = """
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #0F172A, stop:1 #1E293B);
+        color: #F8FAFC;
+    }
+    
+    QWidget {
+        background-color: transparent;
+        color: #F8FAFC;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    
+    QMenuBar {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1E293B, stop:1 #0F172A);
+        color: #F8FAFC;
+        border-bottom: 1px solid #334155;
+        padding: 4px;
+    }
+    
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 8px 12px;
+        border-radius: 6px;
+        font-weight: 500;
+        color: #F8FAFC;
+    }
+    
+    QMenuBar::item:selected {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8B5CF6, stop:1 #7C3AED);
+        color: #FFFFFF;
+    }
+    
+    QToolBar {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1E293B, stop:1 #0F172A);
+        border: none;
+        border-bottom: 1px solid #334155;
+        spacing: 8px;
+        padding: 8px;
+    }
+    
+    QToolBar QToolButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #374151, stop:1 #1F2937);
+        border: 1px solid #4B5563;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-weight: 500;
+        color: #F8FAFC;
+        min-width: 80px;
+    }
+    
+    QToolBar QToolButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4B5563, stop:1 #374151);
+        border-color: #6B7280;
+    }
+    
+    QToolBar QToolButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8B5CF6, stop:1 #7C3AED);
+        border-color: #A855F7;
+    }
+    
+    QStatusBar {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1E293B, stop:1 #0F172A);
+        color: #94A3B8;
+        border-top: 1px solid #334155;
+        padding: 8px;
+        font-size: 10px;
+    }
+"""
+
+# Tab pane and tab bar, set on the tab widget
+_TAB_QSS = """
+    QTabWidget::pane {
+        border: 1px solid #334155;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1E293B, stop:1 #0F172A);
+        border-radius: 12px;
+        margin-top: 8px;
+    }
+    
+    QTabBar::tab {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #334155, stop:1 #1E293B);
+        color: #CBD5E1;
+        padding: 12px 24px;
+        margin-right: 4px;
+        border-top-left-radius: 12px;
+        border-top-right-radius: 12px;
+        font-weight: 500;
+        font-size: 11px;
+        min-width: 100px;
+        border: 1px solid #475569;
+        border-bottom: none;
+    }
+    
+    QTabBar::tab:selected {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8B5CF6, stop:1 #7C3AED);
+        color: #FFFFFF;
+        font-weight: 600;
+        border-color: #A855F7;
+    }
+    
+    QTabBar::tab:hover:!selected {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #475569, stop:1 #334155);
+        color: #F1F5F9;
+    }
+"""
+
+# Inputs only exist inside the tabs, so this is set on the tab widget too
+_INPUT_QSS = """
+    /* Input fields styling */
+    QLineEdit, QTextEdit, QSpinBox, QComboBox {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #374151, stop:1 #1F2937);
+        border: 1px solid #4B5563;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #F8FAFC;
+        font-size: 11px;
+    }
+    
+    QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBox:focus {
+        border-color: #8B5CF6;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4B5563, stop:1 #374151);
+    }
+    
+    /* Checkbox styling */
+    QCheckBox {
+        color: #F8FAFC;
+        font-size: 11px;
+        spacing: 8px;
+    }
+    
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 4px;
+        border: 2px solid #4B5563;
+        background: #1F2937;
+    }
+    
+    QCheckBox::indicator:checked {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8B5CF6, stop:1 #7C3AED);
+        border-color: #A855F7;
+    }
+    
+    QCheckBox::indicator:checked:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #A855F7, stop:1 #8B5CF6);
+    }
+"""
+
+
+# Solid-colour variants for sessions where gradients are slow to repaint
+_MAIN_QSS_SOLID = flatten_gradients(_MAIN_QSS)
+_TAB_QSS_SOLID = flatten_gradients(_TAB_QSS)
+_INPUT_QSS_SOLID = flatten_gradients(_INPUT_QSS)
+
+# Sheets as applied, minified once so Qt parses the smallest text: (window, tab widget)
+_SHEETS = (minify_qss(_MAIN_QSS), minify_qss(_TAB_QSS + _INPUT_QSS))
+_SHEETS_SOLID = (minify_qss(_MAIN_QSS_SOLID), minify_qss(_TAB_QSS_SOLID + _INPUT_QSS_SOLID))
+
+
+_preconnected = False
+
+
+def _preconnect():
+    """Open a connection to the site so the first search or download finds it warm."""
+    try:
+        from core.sites.hentaifox import get_site
+        site = get_site()
+        site.session.head(f"{site.base_url}/", timeout=2, allow_redirects=False)
+    except Exception:
+        pass
+
+
+def _is_lightweight_render() -> bool:
+    """Check for remote or compositor sessions where gradient fills are costly."""
+    return (QApplication.platformName() in ('wayland', 'vnc')
+            or os.environ.get('SESSIONNAME', '').startswith('RDP'))
 
 
 class MainWindow(QMainWindow):
@@ -51,8 +249,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
         self.resize(1200, 800)
         
-        # Center window on screen
-        self.center_on_screen()
+        # Centered on first show, once the frame geometry is known
+        self._centered = False
+        
+        # Minified style sheet currently set on the window
+        self._applied_qss = None
         
         # Setup UI components
         self.setup_ui()
@@ -61,8 +262,8 @@ class MainWindow(QMainWindow):
         self.setup_status_bar()
         self.apply_styling()
         
-        # Apply simple black theme
-        self.setStyleSheet(self.get_simple_stylesheet())
+        # Fill in the toolbar after the first paint
+        QTimer.singleShot(500, self._populate_toolbar)
         
         # Show window normally for now
         # self.show_animated()
@@ -75,6 +276,21 @@ class MainWindow(QMainWindow):
         window.moveCenter(screen.center())
         self.move(window.topLeft())
     
+    def showEvent(self, event):
+        """Center the window the first time it is shown."""
+        global _preconnected
+        
+        if not self._centered:
+            self.center_on_screen()
+            self._centered = True
+        
+        # Resolve DNS and finish the TLS handshake off the GUI thread, once
+        if not _preconnected:
+            _preconnected = True
+            QThreadPool.globalInstance().start(_preconnect)
+        
+        super().showEvent(event)
+    
     def setup_ui(self):
         """Setup the main UI layout."""
         central_widget = QWidget()
@@ -90,89 +306,73 @@ class MainWindow(QMainWindow):
         self.tab_widget.setMovable(False)
         self.tab_widget.setDocumentMode(True)
         
-        # Create tabs (use real tabs if available, fallback to simple ones)
-        from PyQt6.QtWidgets import QLabel
+        # Hold off relayout, repaints and currentChanged until every tab is added
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        
+        self._wired = set()
+        
+        # Every tab starts as a placeholder; the download tab is built now, the rest on first activation
+        self._pending_tabs = dict(_TAB_REGISTRY)
+        for index in sorted(self._pending_tabs):
+            self.tab_widget.addTab(QWidget(), self._pending_tabs[index][3])
+        self._materialize_tab(0)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        
+        self.tab_widget.blockSignals(False)
+        self.tab_widget.setUpdatesEnabled(True)
+        self.tab_widget.update()
+        
+        layout.addWidget(self.tab_widget)
+    
+    def _materialize_tab(self, index: int):
+        """Replace a placeholder tab with the real tab the first time it is shown."""
+        entry = self._pending_tabs.pop(index, None)
+        if entry is None:
+            return
         
-        # Download tab
-        if DOWNLOAD_TAB_AVAILABLE:
-            try:
-                self.download_tab = DownloadTab()
-                self.tab_widget.addTab(self.download_tab, "📥 Download")
-            except Exception as e:
-                print(f"Error creating download tab: {e}")
-                download_tab = QWidget()
-                download_layout = QVBoxLayout(download_tab)
-                download_layout.addWidget(QLabel("📥 Download tab error"))
-                self.tab_widget.addTab(download_tab, "📥 Download")
-        else:
-            download_tab = QWidget()
-            download_layout = QVBoxLayout(download_tab)
-            download_layout.addWidget(QLabel("📥 Download functionality coming soon..."))
-            self.tab_widget.addTab(download_tab, "📥 Download")
-        
-        # Search tab
-        if SEARCH_TAB_AVAILABLE:
-            try:
-                self.search_tab = SearchTab()
-                self.tab_widget.addTab(self.search_tab, "🔍 Search")
-            except Exception as e:
-                print(f"Error creating search tab: {e}")
-                search_tab = QWidget()
-                search_layout = QVBoxLayout(search_tab)
-                search_layout.addWidget(QLabel("🔍 Search tab error"))
-                self.tab_widget.addTab(search_tab, "🔍 Search")
-        else:
-            search_tab = QWidget()
-            search_layout = QVBoxLayout(search_tab)
-            search_layout.addWidget(QLabel("🔍 Search functionality coming soon..."))
-            self.tab_widget.addTab(search_tab, "🔍 Search")
-        
-        # History tab
-        if HISTORY_TAB_AVAILABLE:
-            try:
-                self.history_tab = HistoryTab()
-                self.tab_widget.addTab(self.history_tab, "📚 History")
-            except Exception as e:
-                print(f"Error creating history tab: {e}")
-                history_tab = QWidget()
-                history_layout = QVBoxLayout(history_tab)
-                history_layout.addWidget(QLabel("📚 History tab error"))
-                self.tab_widget.addTab(history_tab, "📚 History")
-        else:
-            history_tab = QWidget()
-            history_layout = QVBoxLayout(history_tab)
-            history_layout.addWidget(QLabel("📚 History functionality coming soon..."))
-            self.tab_widget.addTab(history_tab, "📚 History")
-        
-        # Settings tab
-        if SETTINGS_TAB_AVAILABLE:
-            try:
-                self.settings_tab = SettingsTab()
-                self.tab_widget.addTab(self.settings_tab, "⚙️ Settings")
-            except Exception as e:
-                print(f"Error creating settings tab: {e}")
-                settings_tab = QWidget()
-                settings_layout = QVBoxLayout(settings_tab)
-                settings_layout.addWidget(QLabel("⚙️ Settings tab error"))
-                self.tab_widget.addTab(settings_tab, "⚙️ Settings")
-        else:
-            settings_tab = QWidget()
-            settings_layout = QVBoxLayout(settings_tab)
-            settings_layout.addWidget(QLabel("⚙️ Settings functionality coming soon..."))
-            self.tab_widget.addTab(settings_tab, "⚙️ Settings")
-        
-        # Connect tab signals if tabs are available
+        attr, module_name, class_name, label = entry
         try:
-            if hasattr(self, 'search_tab') and hasattr(self, 'download_tab'):
-                self.search_tab.download_requested.connect(self.download_tab.add_download)
-            if hasattr(self, 'download_tab') and hasattr(self, 'history_tab'):
-                self.download_tab.download_completed.connect(self.history_tab.refresh_history)
-            if hasattr(self, 'settings_tab') and hasattr(self, 'download_tab'):
-                self.settings_tab.settings_changed.connect(self.download_tab.refresh_settings)
+            tab = getattr(importlib.import_module(module_name), class_name)()
+            setattr(self, attr, tab)
         except Exception as e:
-            print(f"Error connecting tab signals: {e}")
+            print(f"Error creating {attr.replace('_', ' ')}: {e}")
+            tab = self._message_tab(f"{label} tab error")
+        
+        # Swap without re-entering this slot through currentChanged
+        was_blocked = self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, label)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(was_blocked)
+        placeholder.deleteLater()
+        
+        self._connect_tab_signals()
+    
+    def _message_tab(self, text: str) -> QWidget:
+        """Create a tab that only shows a message."""
+        from PyQt6.QtWidgets import QLabel
         
-        layout.addWidget(self.tab_widget)
+        tab = QWidget()
+        tab_layout = QVBoxLayout(tab)
+        tab_layout.addWidget(QLabel(text))
+        return tab
+    
+    def _connect_tab_signals(self):
+        """Make every connection in WIRINGS whose tabs both exist and are not yet connected."""
+        for wiring in WIRINGS:
+            if wiring in self._wired:
+                continue
+            
+            src, signal, dst, slot = wiring
+            source = getattr(self, src, None)
+            target = getattr(self, dst, None)
+            if source is None or target is None:
+                continue
+            
+            getattr(source, signal).connect(getattr(target, slot), type=Qt.ConnectionType.QueuedConnection)
+            self._wired.add(wiring)
     
     def setup_menu_bar(self):
         """Setup the menu bar."""
@@ -182,14 +382,14 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("File")
         
         new_download_action = QAction("New Download", self)
-        new_download_action.setShortcut("Ctrl+N")
+        new_download_action.setShortcut(_SHORTCUTS['new_download'])
         new_download_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(0))
         file_menu.addAction(new_download_action)
         
         file_menu.addSeparator()
         
         exit_action = QAction("Exit", self)
-        exit_action.setShortcut("Ctrl+Q")
+        exit_action.setShortcut(_SHORTCUTS['exit'])
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
@@ -197,19 +397,19 @@ class MainWindow(QMainWindow):
         tools_menu = menubar.addMenu("Tools")
         
         search_action = QAction("Search Galleries", self)
-        search_action.setShortcut("Ctrl+F")
+        search_action.setShortcut(_SHORTCUTS['search'])
         search_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(1))
         tools_menu.addAction(search_action)
         
         history_action = QAction("View History", self)
-        history_action.setShortcut("Ctrl+H")
+        history_action.setShortcut(_SHORTCUTS['history'])
         history_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(2))
         tools_menu.addAction(history_action)
         
         tools_menu.addSeparator()
         
         settings_action = QAction("Settings", self)
-        settings_action.setShortcut("Ctrl+,")
+        settings_action.setShortcut(_SHORTCUTS['settings'])
         settings_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(3))
         tools_menu.addAction(settings_action)
         
@@ -221,11 +421,15 @@ class MainWindow(QMainWindow):
         help_menu.addAction(about_action)
     
     def setup_toolbar(self):
-        """Setup the toolbar."""
-        toolbar = QToolBar("Main Toolbar")
-        toolbar.setMovable(False)
-        toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        self.addToolBar(toolbar)
+        """Setup the empty toolbar; actions are added later."""
+        self.toolbar = QToolBar("Main Toolbar")
+        self.toolbar.setMovable(False)
+        self.toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        self.addToolBar(self.toolbar)
+    
+    def _populate_toolbar(self):
+        """Add the toolbar actions."""
+        toolbar = self.toolbar
         
         # Quick download action
         download_action = QAction("📥 Quick Download", self)
@@ -269,173 +473,27 @@ class MainWindow(QMainWindow):
         # Status message
         self.status_bar.showMessage("Ready")
         
-        # Add permanent widgets to status bar
-        self.status_label = self.status_bar
+        # One timer re-armed by every update_status call
+        self._status_reset = QTimer(self)
+        self._status_reset.setSingleShot(True)
+        self._status_reset.timeout.connect(lambda: self.status_bar.showMessage("Ready"))
     
     def get_simple_stylesheet(self):
-        """Get beautiful modern dark theme stylesheet."""
-        return """
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0F172A, stop:1 #1E293B);
-                color: #F8FAFC;
-            }
-            
-            QWidget {
-                background-color: transparent;
-                color: #F8FAFC;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #334155;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1E293B, stop:1 #0F172A);
-                border-radius: 12px;
-                margin-top: 8px;
-            }
-            
-            QTabBar::tab {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #334155, stop:1 #1E293B);
-                color: #CBD5E1;
-                padding: 12px 24px;
-                margin-right: 4px;
-                border-top-left-radius: 12px;
-                border-top-right-radius: 12px;
-                font-weight: 500;
-                font-size: 11px;
-                min-width: 100px;
-                border: 1px solid #475569;
-                border-bottom: none;
-            }
-            
-            QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8B5CF6, stop:1 #7C3AED);
-                color: #FFFFFF;
-                font-weight: 600;
-                border-color: #A855F7;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #475569, stop:1 #334155);
-                color: #F1F5F9;
-            }
-            
-            QMenuBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1E293B, stop:1 #0F172A);
-                color: #F8FAFC;
-                border-bottom: 1px solid #334155;
-                padding: 4px;
-            }
-            
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 8px 12px;
-                border-radius: 6px;
-                font-weight: 500;
-                color: #F8FAFC;
-            }
-            
-            QMenuBar::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8B5CF6, stop:1 #7C3AED);
-                color: #FFFFFF;
-            }
-            
-            QToolBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1E293B, stop:1 #0F172A);
-                border: none;
-                border-bottom: 1px solid #334155;
-                spacing: 8px;
-                padding: 8px;
-            }
-            
-            QToolBar QToolButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #374151, stop:1 #1F2937);
-                border: 1px solid #4B5563;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-weight: 500;
-                color: #F8FAFC;
-                min-width: 80px;
-            }
-            
-            QToolBar QToolButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4B5563, stop:1 #374151);
-                border-color: #6B7280;
-            }
-            
-            QToolBar QToolButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8B5CF6, stop:1 #7C3AED);
-                border-color: #A855F7;
-            }
-            
-            QStatusBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1E293B, stop:1 #0F172A);
-                color: #94A3B8;
-                border-top: 1px solid #334155;
-                padding: 8px;
-                font-size: 10px;
-            }
-            
-            /* Input fields styling */
-            QLineEdit, QTextEdit, QSpinBox, QComboBox {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #374151, stop:1 #1F2937);
-                border: 1px solid #4B5563;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #F8FAFC;
-                font-size: 11px;
-            }
-            
-            QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBox:focus {
-                border-color: #8B5CF6;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4B5563, stop:1 #374151);
-            }
-            
-            /* Checkbox styling */
-            QCheckBox {
-                color: #F8FAFC;
-                font-size: 11px;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #4B5563;
-                background: #1F2937;
-            }
-            
-            QCheckBox::indicator:checked {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #8B5CF6, stop:1 #7C3AED);
-                border-color: #A855F7;
-            }
-            
-            QCheckBox::indicator:checked:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #A855F7, stop:1 #8B5CF6);
-            }
-        """
+        """Get beautiful modern dark theme stylesheet for the window itself."""
+        return _MAIN_QSS_SOLID if _is_lightweight_render() else _MAIN_QSS
     
     def apply_styling(self):
-        """Apply custom styling to the window."""
-        pass  # Styling now handled in get_simple_stylesheet
+        """Apply the simple black theme."""
+        main_qss, tab_qss = _SHEETS_SOLID if _is_lightweight_render() else _SHEETS
+        
+        # Re-applying an unchanged sheet would only make Qt re-polish every widget
+        if main_qss == self._applied_qss:
+            return
+        self._applied_qss = main_qss
+        self.setStyleSheet(main_qss)
         
-        # Styling is now handled in get_simple_stylesheet()
+        # Tab and input rules are matched only against widgets inside the tab widget
+        self.tab_widget.setStyleSheet(tab_qss)
     
     # def show_animated(self):
     #     """Show window with fade in animation."""
@@ -471,13 +529,13 @@ class MainWindow(QMainWindow):
         """Update status bar message."""
         self.status_bar.showMessage(message)
         
-        # Clear message after 5 seconds
-        QTimer.singleShot(5000, lambda: self.status_bar.showMessage("Ready"))
+        # Clear message 5 seconds after the latest update
+        self._status_reset.start(5000)
     
     def closeEvent(self, event):
         """Handle window close event."""
         # Cancel any ongoing downloads
-        if hasattr(self.download_tab, 'cancel_all_downloads'):
+        if hasattr(getattr(self, 'download_tab', None), 'cancel_all_downloads'):
             self.download_tab.cancel_all_downloads()
         
         event.accept()
\ No newline at end of file
@@ -1,74 +1,111 @@
 """Search worker for background searching."""
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from operator import attrgetter
 
-from core.sites.hentaifox import HentaiFoxSite
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
+from core.sites.base import GallerySummary
 
-class SearchWorker(QObject):
-    """Worker for handling search operations in background thread."""
+# GalleryInfo attributes in GallerySummary field order
+_GALLERY_ATTRS = attrgetter('id', 'title', 'url', 'artist', 'pages', 'tags', 'thumbnail_url', 'rating', 'views')
+
+
+class SearchWorker(QRunnable):
+    """Worker for handling search operations on the shared thread pool."""
+    
+    class Signals(QObject):
+        """Signals for the worker, which cannot define its own."""
+        
+        gallery_ready = pyqtSignal(object)  # GallerySummary, as each one is converted
+        search_completed = pyqtSignal(list, int)  # empty list after streaming, total_pages
+        search_error = pyqtSignal(str)  # error_message
+        finished = pyqtSignal()
     
-    # Signals
-    search_completed = pyqtSignal(list, int)  # results, total_pages
-    search_error = pyqtSignal(str)  # error_message
-    finished = pyqtSignal()
+    # Single-shot timer and (query, options, callback) of the search waiting to start
+    _pending_timer = None
+    _pending_args = None
     
     def __init__(self, query: str, options: dict):
         super().__init__()
+        self.signals = SearchWorker.Signals()
         self.query = query
         self.options = options
         self.cancelled = False
-        
-        # Initialize site
-        self.site = HentaiFoxSite()
+        self.site = None
     
-    def start_search(self):
-        """Start the search process."""
+    def run(self):
+        """Run the search."""
         try:
             if self.cancelled:
-                self.finished.emit()
                 return
             
+            # Import the network stack only once a search actually runs
+            from core.sites.hentaifox import get_site
+            self.site = get_site()
+            
             # Perform search based on type
             search_type = self.options.get('search_type', 'all')
             page = self.options.get('page', 1)
-            per_page = self.options.get('per_page', 20)
             sort_by = self.options.get('sort_by', 'newest')
             
             # Use the available search method - handle empty query for browsing
             results = self.site.search(self.query, page=page, sort_by=sort_by, search_type=search_type)
             
             if self.cancelled:
-                self.finished.emit()
                 return
             
             if results and results.galleries:
-                # Convert SearchResult to gallery info format
-                gallery_list = []
+                # Stream each gallery as soon as it is converted
                 for gallery in results.galleries:
-                    gallery_info = {
-                        'id': gallery.id,
-                        'title': gallery.title,
-                        'url': gallery.url,
-                        'artist': getattr(gallery, 'artist', 'Unknown Artist'),
-                        'pages': getattr(gallery, 'pages', 0),
-                        'tags': getattr(gallery, 'tags', []),
-                        'thumbnail': getattr(gallery, 'thumbnail', ''),
-                        'rating': getattr(gallery, 'rating', 0),
-                        'views': getattr(gallery, 'views', 0)
-                    }
-                    gallery_list.append(gallery_info)
+                    if self.cancelled:
+                        return
+                    self.signals.gallery_ready.emit(GallerySummary(*_GALLERY_ATTRS(gallery)))
                 
+                # Rows were already streamed; only the page count is left
                 total_pages = getattr(results, 'total_pages', 1)
-                self.search_completed.emit(gallery_list, total_pages)
+                self.signals.search_completed.emit([], total_pages)
             else:
-                self.search_completed.emit([], 1)
+                self.signals.search_completed.emit([], 1)
                 
         except Exception as e:
-            self.search_error.emit(str(e))
+            self.signals.search_error.emit(str(e))
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
     
     def cancel(self):
         """Cancel the search operation."""
-        self.cancelled = True
\ No newline at end of file
+        self.cancelled = True
+    
+    @staticmethod
+    def schedule(query: str, options: dict, callback, delay_ms: int = 250):
+        """Start a search after delay_ms, replacing any search scheduled before it fires.
+        
+        callback receives the new worker before it is started so its signals can be connected.
+        """
+        if SearchWorker._pending_timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(SearchWorker._start_pending)
+            SearchWorker._pending_timer = timer
+        
+        SearchWorker._pending_args = (query, options, callback)
+        SearchWorker._pending_timer.start(delay_ms)
+    
+    @staticmethod
+    def cancel_scheduled():
+        """Drop the search waiting to start, if any."""
+        if SearchWorker._pending_timer is not None:
+            SearchWorker._pending_timer.stop()
+        SearchWorker._pending_args = None
+    
+    @staticmethod
+    def _start_pending():
+        """Create the scheduled worker and submit it to the shared thread pool."""
+        if SearchWorker._pending_args is None:
+            return
+        
+        query, options, callback = SearchWorker._pending_args
+        SearchWorker._pending_args = None
+        worker = SearchWorker(query, options)
+        callback(worker)
+        QThreadPool.globalInstance().start(worker)
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Thumbnail loading on a dedicated thread pool."""
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from core.thumb_cache import thumb_cache
+
+# Thumbnails get their own pool so a page of them never queues ahead of a search
+_thumbnail_pool = QThreadPool()
+_thumbnail_pool.setMaxThreadCount(4)
+
+
+class ThumbnailRunnable(QRunnable):
+    """Reads a thumbnail from the disk cache or the network and decodes it."""
+
+    class Signals(QObject):
+        """Signals for the runnable, which cannot define its own."""
+
+        loaded = pyqtSignal(str, QImage)  # url, image (null on failure)
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self.signals = ThumbnailRunnable.Signals()
+
+    def run(self):
+        """Load and decode the thumbnail."""
+        image = QImage()
+        try:
+            # Revalidates a cached copy and falls back to it when offline
+            data = thumb_cache.fetch(self.url)
+            if data:
+                image.loadFromData(data)
+        except Exception as e:
+            print(f"Could not load thumbnail: {e}")
+        self.signals.loaded.emit(self.url, image)
+
+
+class ThumbnailLoader(QObject):
+    """Keeps decoded thumbnails in memory and loads missing ones in the background."""
+
+    thumbnail_ready = pyqtSignal(str)  # url
+
+    def __init__(self, max_pixmaps: int = 256):
+        super().__init__()
+        self._pixmaps = OrderedDict()
+        self._max_pixmaps = max_pixmaps
+        self._pending = {}
+        self._failed = set()
+
+    def pixmap(self, url: str):
+        """Get a loaded thumbnail, requesting it if it is not loaded yet."""
+        pixmap = self._pixmaps.get(url)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(url)
+            return pixmap
+
+        if url and url not in self._pending and url not in self._failed:
+            runnable = ThumbnailRunnable(url)
+            runnable.signals.loaded.connect(self._on_loaded)
+            self._pending[url] = runnable
+            _thumbnail_pool.start(runnable)
+        return None
+
+    def _on_loaded(self, url: str, image: QImage):
+        """Convert a decoded image to a pixmap on the GUI thread."""
+        self._pending.pop(url, None)
+        if image.isNull():
+            self._failed.add(url)
+            return
+
+        self._pixmaps[url] = QPixmap.fromImage(image)
+        while len(self._pixmaps) > self._max_pixmaps:
+            self._pixmaps.popitem(last=False)
+        self.thumbnail_ready.emit(url)
+
+
+@lru_cache(maxsize=1)
+def get_thumbnail_loader() -> ThumbnailLoader:
+    """Get the shared thumbnail loader, creating it on first use."""
+    return ThumbnailLoader()
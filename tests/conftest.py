@@ -0,0 +1,11 @@
+"""Shared test setup."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Keep the config created at import out of the real home directory
+os.environ["HOME"] = tempfile.mkdtemp(prefix="hfox-tests-")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,128 @@
+"""Tests for the SQLite search cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import core.cache as cache_module
+from core.cache import SearchCache
+from core.sites.base import GalleryInfo, GallerySummary
+
+
+class FakeClock:
+    """Stand-in for the time module that only moves when told to."""
+
+    def __init__(self, now: int = 1_000_000):
+        self.now = now
+
+    def time(self) -> float:
+        return float(self.now)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = SearchCache(tmp_path / "cache.db")
+    cache.search_ttl = 100
+    cache.gallery_info_ttl = 100
+    cache.max_http_entries = 10
+    return cache
+
+
+def make_info(gallery_id: str) -> GalleryInfo:
+    return GalleryInfo(
+        id=gallery_id,
+        title=f"Gallery {gallery_id}",
+        url=f"https://hentaifox.com/gallery/{gallery_id}/",
+        tags=["tag"],
+    )
+
+
+def make_summary(gallery_id: str) -> GallerySummary:
+    return GallerySummary(
+        id=gallery_id,
+        title=f"Gallery {gallery_id}",
+        url=f"https://hentaifox.com/gallery/{gallery_id}/",
+        artist=None,
+        pages=10,
+        tags=["tag"],
+        thumbnail=None,
+        rating=0.0,
+        views=0,
+    )
+
+
+def test_search_pages_expire_after_ttl(cache, clock):
+    cache.put_search_page("old", [make_summary("1")], 3)
+    clock.now += 60
+    cache.put_search_page("new", [make_summary("2")], 3)
+
+    assert [key for key, _, _ in cache.load_search_pages()] == ["old", "new"]
+
+    clock.now += 50
+    pages = cache.load_search_pages()
+
+    assert [key for key, _, _ in pages] == ["new"]
+    assert pages[0][1] == [make_summary("2")]
+    assert pages[0][2] == 3
+
+
+def test_gallery_info_expires_after_ttl(cache, clock):
+    cache.put_gallery_info(make_info("1"))
+    clock.now += 60
+    cache.put_gallery_info(make_info("2"))
+    clock.now += 50
+
+    infos = cache.load_gallery_info()
+
+    assert list(infos) == [make_info("2").url]
+    assert infos[make_info("2").url] == make_info("2")
+
+
+def test_http_cache_round_trips_validators(cache):
+    info = make_info("1")
+    cache.put_http_cached(info.url, '"abc"', "Mon, 01 Jan 2024 00:00:00 GMT", info)
+
+    assert cache.get_http_cached(info.url) == ('"abc"', "Mon, 01 Jan 2024 00:00:00 GMT", info)
+    assert cache.get_http_cached("https://hentaifox.com/gallery/missing/") is None
+
+
+def test_http_cache_keeps_only_newest_entries(cache, clock):
+    cache.max_http_entries = 2
+    infos = [make_info(str(i)) for i in range(3)]
+    for info in infos:
+        cache.put_http_cached(info.url, None, None, info)
+        clock.now += 1
+
+    assert cache.get_http_cached(infos[0].url) is None
+    assert cache.get_http_cached(infos[1].url) is not None
+    assert cache.get_http_cached(infos[2].url) is not None
+
+
+def test_http_cache_drops_entries_older_than_ttl(cache, clock):
+    old, new = make_info("1"), make_info("2")
+    cache.put_http_cached(old.url, "old", None, old)
+    clock.now += 100
+    cache.put_http_cached(new.url, "new", None, new)
+
+    assert cache.get_http_cached(old.url) is None
+    assert cache.get_http_cached(new.url) == ("new", None, new)
+
+
+def test_clear_removes_everything(cache):
+    info = make_info("1")
+    cache.put_search_page("page", [make_summary("1")], 1)
+    cache.put_gallery_info(info)
+    cache.put_http_cached(info.url, None, None, info)
+
+    cache.clear()
+
+    assert cache.load_search_pages() == []
+    assert cache.load_gallery_info() == {}
+    assert cache.get_http_cached(info.url) is None
@@ -0,0 +1,89 @@
+"""Tests for ConfigManager batching and reloading."""
+
+import os
+
+import pytest
+import yaml
+
+import config.settings as settings_module
+from config.settings import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings_module, "CONFIG_DIRS", [tmp_path])
+    return ConfigManager()
+
+
+def read_file(manager):
+    with open(manager.config_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def test_creates_config_in_first_dir(manager, tmp_path):
+    assert manager.config_path == tmp_path / settings_module.CONFIG_FILENAME
+    assert manager.config_path.exists()
+
+
+def test_batch_saves_once_on_success(manager, monkeypatch):
+    saves = []
+    original_save = manager._save_config_to_file
+    monkeypatch.setattr(manager, "_save_config_to_file",
+                        lambda path, config: (saves.append(path), original_save(path, config)))
+
+    with manager.batch():
+        manager.set("download.max_concurrent", 4)
+        manager.set("ui.theme", "light")
+        assert saves == []
+
+    assert len(saves) == 1
+    assert read_file(manager)["download"]["max_concurrent"] == 4
+    assert read_file(manager)["ui"]["theme"] == "light"
+    assert manager.get("download.max_concurrent") == 4
+
+
+def test_batch_rolls_back_on_error(manager):
+    before = manager.get("download.max_concurrent")
+    on_disk = read_file(manager)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.set("download.max_concurrent", before + 1)
+            manager.update({"ui.theme": "light"})
+            raise RuntimeError("boom")
+
+    assert manager.get("download.max_concurrent") == before
+    assert manager.snapshot()["download.max_concurrent"] == before
+    assert read_file(manager) == on_disk
+    assert manager._suspend_save is False
+
+
+def test_reload_skips_unchanged_mtime(manager):
+    before = manager.get("download.max_concurrent")
+    stat = os.stat(manager.config_path)
+
+    data = read_file(manager)
+    data["download"]["max_concurrent"] = before + 1
+    with open(manager.config_path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f)
+    os.utime(manager.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    manager.reload()
+
+    assert manager.get("download.max_concurrent") == before
+
+
+def test_reload_picks_up_changed_file(manager):
+    before = manager.get("download.max_concurrent")
+    stat = os.stat(manager.config_path)
+
+    data = read_file(manager)
+    data["download"]["max_concurrent"] = before + 1
+    with open(manager.config_path, "w", encoding="utf-8") as f:
+        yaml.dump(data, f)
+    os.utime(manager.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    manager.reload()
+
+    assert manager.get("download.max_concurrent") == before + 1
+    assert manager.snapshot()["download.max_concurrent"] == before + 1